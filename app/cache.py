@@ -0,0 +1,171 @@
+"""
+Short-lived cache for hot read queries
+Uses Redis when REDIS_URL is set (shared between workers),
+otherwise an in-process TTL cache
+"""
+import logging
+import time
+from functools import wraps
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, cast
+
+import orjson
+from cachetools import TTLCache
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+# Cached methods run synchronously on the event loop (via run_sync), so a
+# Redis call may block it for at most this long
+REDIS_SOCKET_TIMEOUT = 0.25
+
+# After a Redis error, use the local cache for this many seconds
+REDIS_RETRY_AFTER = 30
+
+
+class Cache:
+    """Key/value cache with per-entry TTL and namespace invalidation"""
+
+    def __init__(self, redis_url: str = ""):
+        self._redis: Optional["Redis"] = None
+        if redis_url:
+            import redis
+            self._redis = redis.Redis(
+                connection_pool=redis.ConnectionPool.from_url(
+                    redis_url,
+                    socket_timeout=REDIS_SOCKET_TIMEOUT,
+                    socket_connect_timeout=REDIS_SOCKET_TIMEOUT
+                )
+            )
+            logger.info("✅ Using Redis cache")
+        self._redis_down_until = 0.0
+
+        self._local: TTLCache[str, Tuple[Any, float]] = TTLCache(maxsize=1024, ttl=300)
+        self._lock = Lock()
+
+        # Keys known per namespace, so a namespace can be dropped at once
+        self._namespaces: Dict[str, Set[str]] = {}
+
+    def _active_redis(self) -> Optional["Redis"]:
+        """Redis client, or None if not configured or backing off after an error"""
+        if time.monotonic() < self._redis_down_until:
+            return None
+        return self._redis
+
+    def _redis_failed(self, action: str, e: Exception):
+        """Log a Redis error and fall back to the local cache for a while"""
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+        logger.warning(f"⚠️ Redis {action} failed, using local cache for {REDIS_RETRY_AFTER}s: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on miss
+        """
+        client = self._active_redis()
+        if client is not None:
+            try:
+                raw = cast(Optional[bytes], client.get(key))
+                return orjson.loads(raw) if raw is not None else None
+            except Exception as e:
+                self._redis_failed(f"get for {key}", e)
+                return None
+
+        with self._lock:
+            entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        return value if expires_at > time.monotonic() else None
+
+    def register(self, namespace: str, key: str):
+        """
+        Attach a key to a namespace for bulk invalidation
+
+        Args:
+            namespace: Namespace name
+            key: Cache key
+        """
+        self._namespaces.setdefault(namespace, set()).add(key)
+
+    def set(self, key: str, value: Any, ttl: int):
+        """
+        Store value in cache
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time to live in seconds
+        """
+        client = self._active_redis()
+        if client is not None:
+            try:
+                client.set(key, orjson.dumps(value), ex=ttl)
+            except Exception as e:
+                self._redis_failed(f"set for {key}", e)
+            return
+
+        with self._lock:
+            self._local[key] = (value, time.monotonic() + ttl)
+
+    def invalidate(self, namespace: str):
+        """
+        Drop every key stored under a namespace
+
+        Args:
+            namespace: Namespace to clear
+        """
+        keys = list(self._namespaces.get(namespace, ()))
+        if not keys:
+            return
+
+        # Local entries may exist from a Redis outage, drop them too
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+        client = self._active_redis()
+        if client is not None:
+            try:
+                client.delete(*keys)
+            except Exception as e:
+                self._redis_failed(f"invalidation for {namespace}", e)
+
+
+def cached(ttl: int, namespace: str) -> Callable:
+    """
+    Cache the result of an argument-less repository method
+
+    Args:
+        ttl: Time to live in seconds
+        namespace: Cache namespace, also the key prefix
+    """
+    def decorator(func: Callable) -> Callable:
+        key = f"{namespace}:{func.__name__}"
+        cache.register(namespace, key)
+
+        @wraps(func)
+        def wrapper(self):
+            value = cache.get(key)
+            if value is None:
+                value = func(self)
+                cache.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+# Singleton instance
+cache = Cache(settings.REDIS_URL)
@@ -2,21 +2,34 @@
 Configuration management for News System
 Centralized configuration with validation
 """
-import os
+from functools import cached_property, lru_cache
 from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import field_validator, model_validator
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+# Required settings and their descriptions (checked once, after parsing)
+REQUIRED_SETTINGS = {
+    "SECRET_KEY": "Secret key for session encryption",
+    "ADMIN_USERNAME": "Admin username",
+    "ADMIN_PASSWORD_HASH": "Hashed admin password",
+    "WEBZ_API_KEYS": "Webz.io API keys",
+    "TELEGRAM_BOT_TOKEN": "Telegram bot token",
+    "TELEGRAM_CHANNEL": "Telegram channel ID",
+    "SECRET_PATH": "Secret path for admin panel"
+}
+
+
 class Settings(BaseSettings):
     """Application settings with validation"""
     
     # Application
     APP_NAME: str = "News Management System"
     DEBUG: bool = False
+    SQL_ECHO: bool = False  # Log every SQL statement (very noisy, debugging only)
     
     # Server Configuration
     APP_HOST: str = "0.0.0.0"
@@ -32,12 +45,23 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///news.db"
+    # Per engine; the app runs a sync and an async engine, so one worker can
+    # open up to 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. Keep
+    # workers * that below PostgreSQL max_connections (100 by default)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a free connection
     
     # Security
     SECRET_KEY: str = ""
     ADMIN_USERNAME: str = ""
     ADMIN_PASSWORD_HASH: str = ""
     SESSION_EXPIRE_HOURS: int = 24
+    # bcrypt cost for new password hashes (2^rounds iterations). 10 follows
+    # OWASP; do not go below 8 even on very small machines. Verifying an
+    # existing hash always uses the cost stored in that hash
+    BCRYPT_ROUNDS: int = 10
     
     # API Keys - as strings, will be parsed to lists
     WEBZ_API_KEYS: str = ""
@@ -64,19 +88,22 @@ class Settings(BaseSettings):
     CRAWLER_INTERVAL_HOURS: int = 1
     PUBLISHER_INTERVAL_MINUTES: int = 30
     
+    # Cache (leave empty for in-process caching)
+    REDIS_URL: str = ""
+    
     # Logging
     LOG_FILE: str = "webz.log"
     LOG_LEVEL: str = "INFO"
     
-    # Property methods to get API keys as lists
-    @property
+    # Parsed once per instance; the env strings never change at runtime
+    @cached_property
     def webz_api_keys_list(self) -> List[str]:
         """Get WEBZ API keys as list"""
         if not self.WEBZ_API_KEYS or not self.WEBZ_API_KEYS.strip():
             return []
         return [k.strip() for k in self.WEBZ_API_KEYS.split(",") if k.strip()]
     
-    @property
+    @cached_property
     def gemini_api_keys_list(self) -> List[str]:
         """Get Gemini API keys as list"""
         if not self.GEMINI_API_KEYS or not self.GEMINI_API_KEYS.strip():
@@ -132,40 +159,40 @@ class Settings(BaseSettings):
             raise ValueError("SECRET_PATH must contain only alphanumeric characters, dashes, and underscores")
         return v
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "allow"
+    @model_validator(mode="after")
+    def validate_required(self):
+        """Validate all required settings are present"""
+        missing = [
+            f"{var} ({description})"
+            for var, description in REQUIRED_SETTINGS.items()
+            if not str(getattr(self, var) or "").strip()
+        ]
+        
+        if missing:
+            raise ValueError(
+                f"Missing required environment variables:\n" + 
+                "\n".join(f"  - {var}" for var in missing)
+            )
+        return self
+    
+    # Immutable after load; unknown env entries are ignored, not stored
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        frozen=True,
+        extra="ignore"
+    )
 
 
-# Singleton instance
-settings = Settings()
-
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings
+    Memoized so repeated calls (and re-imports) reuse one instance
+    """
+    return Settings()
 
-def validate_environment():
-    """Validate all required environment variables"""
-    required_vars = {
-        "SECRET_KEY": "Secret key for session encryption",
-        "ADMIN_USERNAME": "Admin username",
-        "ADMIN_PASSWORD_HASH": "Hashed admin password",
-        "WEBZ_API_KEYS": "Webz.io API keys",
-        "TELEGRAM_BOT_TOKEN": "Telegram bot token",
-        "TELEGRAM_CHANNEL": "Telegram channel ID",
-        "SECRET_PATH": "Secret path for admin panel"
-    }
-    
-    missing = []
-    for var, description in required_vars.items():
-        value = os.getenv(var)
-        if not value or not value.strip():
-            missing.append(f"{var} ({description})")
-    
-    if missing:
-        raise ValueError(
-            f"Missing required environment variables:\n" + 
-            "\n".join(f"  - {var}" for var in missing)
-        )
 
+# Singleton instance
+settings = get_settings()
 
-# Validate on import
-validate_environment()
\ No newline at end of file
@@ -1,53 +1,421 @@
 """
 Database configuration and setup
 """
+import json
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from app.config import settings
-from app.models.news import Base
+import warnings
+from sqlalchemy import create_engine, event, inspect, text
+from typing import AsyncGenerator
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker, Session
+from sqlalchemy.schema import CreateIndex
+from app.config import get_settings
+from app.models.news import Base, STATUS_ENUM
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+IS_SQLITE = 'sqlite' in settings.DATABASE_URL
+IS_POSTGRES = settings.DATABASE_URL.startswith('postgres')
+
+# Set by create_sqlite_search_index() once the FTS5 table is in place
+SQLITE_FTS = False
+
+# psycopg2 only: batch non-INSERT executemany calls as well
+# (INSERT paging is controlled by insertmanyvalues_page_size below)
+DIALECT_OPTIONS = (
+    {
+        'executemany_mode': 'values_plus_batch',
+        'executemany_batch_page_size': 500,
+    }
+    if make_url(settings.DATABASE_URL).get_driver_name() == 'psycopg2' else {}
+)
+
+# Pool sizing shared by both engines (see DB_POOL_SIZE in config)
+POOL_OPTIONS = {
+    'pool_size': settings.DB_POOL_SIZE,
+    'max_overflow': settings.DB_MAX_OVERFLOW,
+    'pool_timeout': settings.DB_POOL_TIMEOUT,
+}
+
 # Create engine
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={'check_same_thread': False} if 'sqlite' in settings.DATABASE_URL else {},
+    connect_args={'check_same_thread': False} if IS_SQLITE else {},
     pool_pre_ping=True,
-    echo=settings.DEBUG
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    insertmanyvalues_page_size=1000,
+    echo=settings.SQL_ECHO,
+    **POOL_OPTIONS,
+    **DIALECT_OPTIONS
 )
 
+# Async drivers per backend, used by the request handlers
+# (the sync engine above stays for scheduler jobs and the crawler)
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+}
+
+
+def _async_url(url: str):
+    """Swap the sync driver of a database URL for its async counterpart"""
+    parsed = make_url(url)
+    return parsed.set(
+        drivername=ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    )
+
+
+# Create async engine
+# (aiosqlite picks its own pool class, which may not take sizing arguments)
+async_engine = create_async_engine(
+    _async_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=settings.SQL_ECHO,
+    **({} if IS_SQLITE else POOL_OPTIONS)
+)
+
+if not settings.DEBUG:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune each new SQLite connection
+        WAL lets scheduler threads read while another thread writes
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects stay readable after commit without a refetch
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine
+)
+
+# Async session factory for request handlers
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+if settings.DEBUG:
+    @event.listens_for(Session, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state: ORMExecuteState):
+        """
+        Development: make lazy relationship loads raise instead of issuing
+        one query per row (N+1); load relationships explicitly with
+        selectinload()/joinedload(), which take precedence
+        Applies to sync and async sessions (AsyncSession wraps a Session)
+        """
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
+# Set once the schema has been checked, so re-imports skip the work
+_INITIALIZED = False
 
 
 def init_database():
     """Initialize database and create tables"""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    
     try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Database tables created successfully")
+        if not inspect(engine).has_table("news"):
+            Base.metadata.create_all(bind=engine)
+            logger.info("✅ Database tables created successfully")
+        else:
+            if IS_POSTGRES:
+                migrate_status_to_enum()
+                migrate_status_enum_values()
+                migrate_timestamp_defaults()
+            elif IS_SQLITE:
+                migrate_sqlite_timestamps()
+            migrate_score_not_null()
+            create_missing_indexes()
         
         # Verify database structure
         verify_database_structure()
+        migrate_categories_to_json()
+        if IS_POSTGRES:
+            create_search_indexes()
+        elif IS_SQLITE:
+            create_sqlite_search_index()
+        _INITIALIZED = True
         
     except Exception as e:
         logger.error(f"❌ Failed to initialize database: {e}")
         raise
 
 
+def migrate_status_to_enum():
+    """
+    Convert a legacy VARCHAR status column to the news_status ENUM (PostgreSQL)
+    The partial indexes compare status against text literals, so they
+    are dropped first and rebuilt by create_missing_indexes()
+    """
+    with engine.begin() as conn:
+        data_type = conn.execute(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'news' AND column_name = 'status'"
+        )).scalar()
+        
+        if data_type == "USER-DEFINED":
+            return
+        
+        STATUS_ENUM.create(conn, checkfirst=True)
+        conn.execute(text("DROP INDEX IF EXISTS idx_translate_queue_score"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_publish_queue_published"))
+        conn.execute(text(
+            "ALTER TABLE news ALTER COLUMN status TYPE news_status "
+            "USING status::news_status"
+        ))
+    
+    logger.info("🔧 Converted news.status to news_status ENUM")
+
+
+def migrate_status_enum_values():
+    """
+    Add statuses introduced after the news_status ENUM was created (PostgreSQL)
+    ALTER TYPE ... ADD VALUE cannot run inside a transaction block on
+    older servers, so this uses an autocommit connection. Idempotent
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for status in STATUS_ENUM.enums:
+            conn.execute(text(
+                f"ALTER TYPE news_status ADD VALUE IF NOT EXISTS '{status}'"
+            ))
+
+
+def migrate_timestamp_defaults():
+    """
+    Switch created_at/updated_at defaults to UTC (PostgreSQL)
+    Tables created with a plain now() default store the session's local
+    time; existing rows are left as they are. Idempotent
+    """
+    with engine.begin() as conn:
+        for column in ("created_at", "updated_at"):
+            conn.execute(text(
+                f"ALTER TABLE news ALTER COLUMN {column} "
+                f"SET DEFAULT timezone('utc', now())"
+            ))
+
+
+def migrate_score_not_null():
+    """
+    Backfill NULL scores with 0 and forbid new ones
+    SQLite cannot add NOT NULL to an existing column; there the model
+    default keeps new rows non-NULL. Idempotent
+    """
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE news SET score = 0 WHERE score IS NULL"))
+        if IS_POSTGRES:
+            conn.execute(text("ALTER TABLE news ALTER COLUMN score SET DEFAULT 0"))
+            conn.execute(text("ALTER TABLE news ALTER COLUMN score SET NOT NULL"))
+
+
+def migrate_sqlite_timestamps():
+    """
+    Rewrite second-precision timestamps in SQLAlchemy's storage format (SQLite)
+    Rows written by the old CURRENT_TIMESTAMP default lack the fractional
+    part, which breaks text comparisons against bound datetimes. Idempotent
+    """
+    with engine.begin() as conn:
+        for column in ("created_at", "updated_at"):
+            conn.execute(text(
+                f"UPDATE news SET {column} = {column} || '.000000' "
+                f"WHERE length({column}) = 19"
+            ))
+
+
+def create_missing_indexes():
+    """
+    Add indexes declared on the models but missing from an existing database
+    create_all() skips tables that already exist, so new indexes would
+    otherwise only reach fresh installs
+    The inspector is only used to skip known indexes: SQLite does not
+    report expression indexes (idx_title_prefix), so the CREATE itself
+    must tolerate an index that already exists
+    """
+    inspector = inspect(engine)
+    with warnings.catch_warnings():
+        # SQLite reflection skips the expression index with an SAWarning
+        warnings.filterwarnings(
+            "ignore",
+            message="Skipped unsupported reflection of expression-based index",
+            category=SAWarning
+        )
+        existing = {
+            index["name"]
+            for table in Base.metadata.sorted_tables
+            for index in inspector.get_indexes(table.name)
+        }
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+                    logger.debug(f"🔧 Ensured index {index.name}")
+
+
 def verify_database_structure():
-    """Verify database structure"""
+    """
+    Verify database structure
+    The per-status count doubles as a warm-up of the news table and
+    idx_status_score before the scheduler's first tick
+    """
+    db = SessionLocal()
     try:
-        db = SessionLocal()
-        # Simple query to test connection
-        db.execute("SELECT 1 FROM news LIMIT 1")
-        db.close()
+        counts = db.execute(
+            text("SELECT status, COUNT(*) FROM news GROUP BY status")
+        ).all()
         logger.info("✅ Database structure verified")
+        
+        if counts:
+            summary = ", ".join(f"{status}={count}" for status, count in counts)
+            logger.info(f"📊 News by status: {summary}")
+    finally:
+        db.close()
+
+
+def migrate_categories_to_json():
+    """
+    Convert legacy comma-separated categories to JSON arrays
+    Only rows still holding the old format are touched, so this is a
+    no-op once the data has been migrated
+    """
+    with engine.begin() as conn:
+        rows = conn.execute(text(
+            "SELECT id, categories FROM news "
+            "WHERE categories IS NOT NULL AND CAST(categories AS TEXT) NOT LIKE '[%'"
+        )).all()
+        
+        if not rows:
+            return
+        
+        conn.execute(
+            text("UPDATE news SET categories = :categories WHERE id = :id"),
+            [
+                {
+                    "id": news_id,
+                    "categories": json.dumps(
+                        [cat.strip() for cat in categories.split(',') if cat.strip()],
+                        ensure_ascii=False
+                    )
+                }
+                for news_id, categories in rows
+            ]
+        )
+    
+    logger.info(f"🔧 Migrated categories of {len(rows)} news to JSON")
+
+
+def create_search_indexes():
+    """
+    Create PostgreSQL indexes used by NewsRepository search methods
+    GIN + gin_trgm_ops lets ILIKE '%q%' use an index instead of a
+    sequential scan; news_fts serves search_fts(). Idempotent, safe to
+    run on every startup
+    """
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name, column in (
+            ("news_title_trgm", "title"),
+            ("news_highlight_trgm", "highlight_text"),
+            ("news_summary_trgm", "translated_summary"),
+        ):
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {name} "
+                f"ON news USING gin ({column} gin_trgm_ops)"
+            ))
+        
+        # Full-text index, must match _search_document() in news_repository
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS news_fts ON news USING gin ("
+            "to_tsvector('simple', coalesce(title, '') || ' ' || "
+            "coalesce(highlight_text, '') || ' ' || "
+            "coalesce(translated_summary, '')))"
+        ))
+    
+    logger.info("✅ Search indexes verified")
+
+
+def create_sqlite_search_index():
+    """
+    Create the news_fts FTS5 table used by search_fts() on SQLite
+    External-content table kept in sync by triggers, so the text is not
+    stored twice; status updates do not touch it. Skipped (search falls
+    back to LIKE) when SQLite was built without FTS5
+    """
+    global SQLITE_FTS
+    
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+            )).first()
+            
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+                "title, highlight_text, translated_summary, "
+                "content='news', content_rowid='id')"
+            ))
+            conn.execute(text(
+                "CREATE TRIGGER IF NOT EXISTS news_fts_insert AFTER INSERT ON news BEGIN "
+                "INSERT INTO news_fts(rowid, title, highlight_text, translated_summary) "
+                "VALUES (new.id, new.title, new.highlight_text, new.translated_summary); "
+                "END"
+            ))
+            conn.execute(text(
+                "CREATE TRIGGER IF NOT EXISTS news_fts_delete AFTER DELETE ON news BEGIN "
+                "INSERT INTO news_fts(news_fts, rowid, title, highlight_text, translated_summary) "
+                "VALUES ('delete', old.id, old.title, old.highlight_text, old.translated_summary); "
+                "END"
+            ))
+            conn.execute(text(
+                "CREATE TRIGGER IF NOT EXISTS news_fts_update "
+                "AFTER UPDATE OF title, highlight_text, translated_summary ON news BEGIN "
+                "INSERT INTO news_fts(news_fts, rowid, title, highlight_text, translated_summary) "
+                "VALUES ('delete', old.id, old.title, old.highlight_text, old.translated_summary); "
+                "INSERT INTO news_fts(rowid, title, highlight_text, translated_summary) "
+                "VALUES (new.id, new.title, new.highlight_text, new.translated_summary); "
+                "END"
+            ))
+            
+            # Index rows that were stored before the table existed
+            if not exists:
+                conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+                logger.info("🔧 Built news_fts full-text index")
+        
+        SQLITE_FTS = True
+        
     except Exception as e:
-        logger.warning(f"⚠️ Database verification issue: {e}")
-        logger.info("🔧 Recreating tables...")
-        Base.metadata.create_all(bind=engine)
-        logger.info("✅ Tables recreated successfully")
+        logger.warning(f"⚠️ SQLite full-text search unavailable: {e}")
 
 
 def get_db() -> Session:
@@ -62,5 +430,15 @@ def get_db() -> Session:
         db.close()
 
 
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting an async database session
+    Use with FastAPI Depends in async route handlers
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Initialize database on import
 init_database()
\ No newline at end of file
@@ -2,13 +2,29 @@
 FastAPI dependencies
 Common dependencies for route handlers
 """
+from threading import Lock
 from typing import Generator, Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
 from app.services.auth import auth_service
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
+
+# Login page redirect for unauthenticated browser requests (computed once)
+_LOGIN_REDIRECT = f"/{settings.SECRET_PATH}/"
+
+# Recently seen invalid session tokens (stale tabs, scrapers)
+# Tokens are random and never reissued, so an invalid token stays invalid
+_invalid_tokens: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = Lock()
+
+# Recently verified session tokens -> username
+# Revocation (logout) drops the entry at once, expiry lags by at most the TTL
+_valid_tokens: TTLCache[str, str] = TTLCache(maxsize=4096, ttl=30)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -27,6 +43,52 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _auth_error(request: Request, detail: str) -> HTTPException:
+    """
+    Build the authentication error for a request
+    Browsers are redirected to the login page, API clients get 401
+    """
+    if "text/html" in request.headers.get("accept", ""):
+        return HTTPException(
+            status_code=303,
+            headers={"Location": _LOGIN_REDIRECT}
+        )
+    return HTTPException(status_code=401, detail=detail)
+
+
+def _resolve_user(session_token: str) -> Optional[str]:
+    """
+    Resolve a session token to a username
+    Short-circuits tokens already known to be valid or invalid
+    """
+    with _token_cache_lock:
+        username = _valid_tokens.get(session_token)
+        if username:
+            return username
+        if session_token in _invalid_tokens:
+            return None
+    
+    username = auth_service.resolve_session(session_token)
+    with _token_cache_lock:
+        if username:
+            _valid_tokens[session_token] = username
+        else:
+            _invalid_tokens[session_token] = True
+    return username
+
+
+def forget_session(session_token: str):
+    """
+    Drop a session token from the verification cache
+    Call after the session is deleted (logout)
+    
+    Args:
+        session_token: Session token
+    """
+    with _token_cache_lock:
+        _valid_tokens.pop(session_token, None)
+
+
 def get_current_user(request: Request) -> str:
     """
     Authentication dependency
@@ -42,46 +104,20 @@ def get_current_user(request: Request) -> str:
     session_token = request.cookies.get("session_token")
     
     if not session_token:
-        # Check if HTML request (browser) or API request
-        accept_header = request.headers.get("accept", "")
-        if "text/html" in accept_header:
-            # Redirect to login page with correct SECRET_PATH
-            raise HTTPException(
-                status_code=303,
-                headers={"Location": f"/{settings.SECRET_PATH}/"}
-            )
-        else:
-            # Return 401 for API requests
-            raise HTTPException(
-                status_code=401,
-                detail="Not authenticated"
-            )
-    
-    # Verify session (returns True/False)
-    is_valid = auth_service.verify_session(session_token)
+        raise _auth_error(request, "Not authenticated")
     
-    if not is_valid:
-        accept_header = request.headers.get("accept", "")
-        if "text/html" in accept_header:
-            raise HTTPException(
-                status_code=303,
-                headers={"Location": f"/{settings.SECRET_PATH}/"}
-            )
-        else:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired session"
-            )
+    # Reuse the user already resolved for this request, if any
+    username = getattr(request.state, "user", None)
+    if username:
+        return username
     
-    # Get username from session
-    username = auth_service.get_session_username(session_token)
+    # Verify session and get username in a single lookup
+    username = _resolve_user(session_token)
     
     if not username:
-        raise HTTPException(
-            status_code=401,
-            detail="Session error"
-        )
+        raise _auth_error(request, "Invalid or expired session")
     
+    request.state.user = username
     return username
 
 
@@ -105,11 +141,14 @@ def get_optional_user(request: Request) -> Optional[str]:
     if not session_token:
         return None
     
-    # Verify session
-    is_valid = auth_service.verify_session(session_token)
+    # Reuse the user already resolved for this request, if any
+    username = getattr(request.state, "user", None)
+    if username:
+        return username
     
-    if not is_valid:
-        return None
+    # Verify session and get username in a single lookup
+    username = _resolve_user(session_token)
     
-    # Get username
-    return auth_service.get_session_username(session_token)
\ No newline at end of file
+    if username:
+        request.state.user = username
+    return username
\ No newline at end of file
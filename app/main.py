@@ -2,31 +2,33 @@
 Main FastAPI application
 Lightweight entry point with all logic delegated to services
 """
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from app.config import settings
+from app.config import get_settings
 from app.routers import auth, news, admin
 from app.services.crawler import async_crawler_service
 from app.services.translator import translation_service
-from app.repositories.news_repository import NewsRepository
+from app.repositories.news_repository import NewsRepository, TRANSLATION_CLAIM_TIMEOUT
 from app.services.telegram import telegram_service
 from app.models.news import NewsStatus
-from app.database import SessionLocal
-
-# Configure logging
-logging.basicConfig(
-    filename=settings.LOG_FILE,
-    level=getattr(logging, settings.LOG_LEVEL),
-    encoding='utf-8',
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from app.database import SessionLocal, async_engine
+from app.utils.logging import stop_logging
+from app.utils.static_pages import load_static_pages
+
+settings = get_settings()
+
+# Logging is configured on import of app.utils.logging (queue-based,
+# records are written by a background listener thread)
 
 logger = logging.getLogger(__name__)
 
@@ -34,27 +36,43 @@ logger = logging.getLogger(__name__)
 scheduler = BackgroundScheduler()
 
 
+def _crawl_language(lang: str) -> int:
+    """
+    Crawl a single language with its own database session
+    Runs inside a worker thread; sessions are not shared across threads
+    """
+    db = SessionLocal()
+    try:
+        news_list = asyncio.run(async_crawler_service.crawl_news(
+            db=db,
+            language=lang,
+            max_pages=3,
+            limit=50
+        ))
+        return len(news_list)
+    finally:
+        db.close()
+
+
 def scheduled_crawler():
     """Scheduled crawler job"""
     try:
         logger.info("Starting scheduled crawler...")
-        db = SessionLocal()
         
-        # Crawl multiple languages
+        # Crawl multiple languages in parallel (network-bound)
         languages = ['english', 'french', 'arabic', 'chinese']
-        for lang in languages:
-            try:
-                news_list = async_crawler_service.crawl_news(
-                    db=db,
-                    language=lang,
-                    max_pages=3,
-                    limit=50
-                )
-                logger.info(f"Scheduled crawl: collected {len(news_list)} news for {lang}")
-            except Exception as e:
-                logger.error(f"Scheduled crawl error for {lang}: {e}")
-        
-        db.close()
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = {
+                executor.submit(_crawl_language, lang): lang
+                for lang in languages
+            }
+            for future in as_completed(futures):
+                lang = futures[future]
+                try:
+                    count = future.result()
+                    logger.info(f"Scheduled crawl: collected {count} news for {lang}")
+                except Exception as e:
+                    logger.error(f"Scheduled crawl error for {lang}: {e}")
         
     except Exception as e:
         logger.error(f"Scheduled crawler failed: {e}")
@@ -67,30 +85,29 @@ def scheduled_publisher():
         db = SessionLocal()
         repo = NewsRepository(db)
         
-        # Get news ready for publishing
-        ready_news = repo.get_for_publishing(limit=10)
+        # Pick one random news from the publishing queue
+        news = repo.get_one_for_publishing_random()
         
-        if not ready_news:
+        if not news:
             # Check if any news is ready for final approval
-            ready_news = repo.get_by_status(NewsStatus.READY_FOR_FINAL, limit=5)
-            if ready_news:
-                for news in ready_news:
-                    repo.update_status(news.id, NewsStatus.PUBLISHED_QUEUE)
-                logger.info(f"Moved {len(ready_news)} news to publishing queue")
+            moved = repo.move_status(
+                NewsStatus.READY_FOR_FINAL,
+                NewsStatus.PUBLISHED_QUEUE,
+                limit=5
+            )
+            if moved:
+                logger.info(f"Moved {moved} news to publishing queue")
+                news = repo.get_one_for_publishing_random()
         
-        if ready_news:
-            # Publish one random news
-            import random
-            news = random.choice(ready_news)
-            
+        if news:
             message = telegram_service.create_news_message(news)
             success = telegram_service.send_message(message)
             
             if success:
-                repo.update_status(news.id, NewsStatus.PUBLISHED)
-                logger.info(f"Published news {news.id}: {news.title}")
+                repo.update_status(news["id"], NewsStatus.PUBLISHED)
+                logger.info(f"Published news {news['id']}: {news['title']}")
             else:
-                logger.error(f"Failed to publish news {news.id}")
+                logger.error(f"Failed to publish news {news['id']}")
         else:
             logger.info("No news available to publish")
         
@@ -107,25 +124,32 @@ def scheduled_translator():
         db = SessionLocal()
         repo = NewsRepository(db)
         
-        # Get news approved for translation
-        news_list = repo.get_for_translation(limit=5)
+        # Retry news whose translator run died mid-way
+        repo.release_translation_claims(older_than=TRANSLATION_CLAIM_TIMEOUT)
+        
+        # Claim news approved for translation
+        news_list = repo.claim_for_translation(limit=5)
+        
+        # Translate the whole batch concurrently
+        results = translation_service.translate_batch(
+            [news.highlight_text or news.title for news in news_list]
+        )
+        
+        translations = {}
+        failed_ids = []
+        for news, translated in zip(news_list, results):
+            if translated:
+                translations[news.id] = (translated, translated)
+                logger.info(f"Translated news {news.id}")
+            else:
+                failed_ids.append(news.id)
+                logger.warning(f"Translation failed for news {news.id}")
         
-        for news in news_list:
-            try:
-                text_to_translate = news.highlight_text or news.title
-                translated = translation_service.translate(text_to_translate)
-                
-                if translated:
-                    repo.update_translation(news.id, translated, translated)
-                    logger.info(f"Translated news {news.id}")
-                else:
-                    logger.warning(f"Translation failed for news {news.id}")
-                    
-            except Exception as e:
-                logger.error(f"Translation error for news {news.id}: {e}")
+        repo.bulk_update_translations(translations)
+        repo.release_translation_claims(failed_ids)
         
         if news_list:
-            logger.info(f"Translated {len(news_list)} news articles")
+            logger.info(f"Translated {len(translations)} of {len(news_list)} news articles")
         
         db.close()
         
@@ -143,6 +167,9 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting News Management System...")
     logger.info(f"📊 Environment: {'DEBUG' if settings.DEBUG else 'PRODUCTION'}")
     
+    # Preload HTML pages
+    app.state.static_html = load_static_pages()
+    
     # Schedule jobs
     scheduler.add_job(
         scheduled_crawler, 
@@ -168,7 +195,7 @@ async def lifespan(app: FastAPI):
     
     # Test connections
     try:
-        telegram_status = telegram_service.test_connection()
+        telegram_status = await telegram_service.async_test_connection()
         logger.info(f"📱 Telegram: {'✅ Connected' if telegram_status else '❌ Failed'}")
     except Exception as e:
         logger.warning(f"⚠️ Telegram test failed: {e}")
@@ -179,6 +206,10 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 Shutting down News Management System...")
     scheduler.shutdown()
     logger.info("✅ Scheduler stopped")
+    await telegram_service.aclose()
+    await admin.close_http_client()
+    await async_engine.dispose()
+    stop_logging()
 
 
 # Create FastAPI app
@@ -186,7 +217,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="Professional news management and publishing system",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Rate limiting
@@ -194,8 +226,21 @@ limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets instead of re-requesting them"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=86400")
+        return response
+
+
 # Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount(
+    "/static",
+    CachedStaticFiles(directory="static", html=False, check_dir=True),
+    name="static"
+)
 
 # Include routers
 app.include_router(auth.router)
@@ -2,9 +2,13 @@
 Database models for News System
 SQLAlchemy ORM models with proper indexes and relationships
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index
-from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+import enum
+from typing import ClassVar, FrozenSet
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index, JSON, Enum, func, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
@@ -13,22 +17,106 @@ class NewsStatus:
     """News status constants"""
     COLLECTED = "collected"
     APPROVED_FOR_TRANSLATE = "approved_for_translate"
+    TRANSLATING = "translating"  # Claimed by one translator run
     TRANSLATED_EDITED = "translated_edited"
     READY_FOR_FINAL = "ready_for_final"
     PUBLISHED_QUEUE = "published_queue"
     PUBLISHED = "published"
     
+    # Built once; membership checks are O(1)
+    ALL: ClassVar[FrozenSet[str]] = frozenset({
+        COLLECTED,
+        APPROVED_FOR_TRANSLATE,
+        TRANSLATING,
+        TRANSLATED_EDITED,
+        READY_FOR_FINAL,
+        PUBLISHED_QUEUE,
+        PUBLISHED
+    })
+    
     @classmethod
     def all_statuses(cls):
         """Get all available statuses"""
-        return [
-            cls.COLLECTED,
-            cls.APPROVED_FOR_TRANSLATE,
-            cls.TRANSLATED_EDITED,
-            cls.READY_FOR_FINAL,
-            cls.PUBLISHED_QUEUE,
-            cls.PUBLISHED
-        ]
+        return cls.ALL
+
+
+# Query parameter enum for the status filter (invalid values get a 422)
+StatusFilter = enum.Enum(
+    "StatusFilter",
+    {status: status for status in (
+        NewsStatus.COLLECTED,
+        NewsStatus.APPROVED_FOR_TRANSLATE,
+        NewsStatus.TRANSLATING,
+        NewsStatus.TRANSLATED_EDITED,
+        NewsStatus.READY_FOR_FINAL,
+        NewsStatus.PUBLISHED_QUEUE,
+        NewsStatus.PUBLISHED
+    )},
+    type=str
+)
+
+
+class OrderBy(str, enum.Enum):
+    """Sort fields for news lists"""
+    # Member names equal their values, so plain strings hash to the same key
+    published = "published"
+    score = "score"
+    created_at = "created_at"
+
+
+class utcnow(FunctionElement):
+    """
+    Current time in UTC as a naive timestamp
+    Timestamps are stored without time zone and compared against
+    datetime.utcnow(); now() alone follows the PostgreSQL session TimeZone
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    """Generic SQL"""
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    """
+    SQLite: UTC in SQLAlchemy's own DateTime storage format
+    CURRENT_TIMESTAMP has no fractional part, so the stored text would not
+    compare equal to the same datetime bound as a parameter (keyset cursors)
+    """
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    """PostgreSQL"""
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw):
+    """MySQL (parenthesized so it is also valid as a column default)"""
+    return "(UTC_TIMESTAMP())"
+
+
+# Native ENUM on PostgreSQL (4-byte compares), plain VARCHAR elsewhere
+STATUS_ENUM = Enum(
+    NewsStatus.COLLECTED,
+    NewsStatus.APPROVED_FOR_TRANSLATE,
+    NewsStatus.TRANSLATING,
+    NewsStatus.TRANSLATED_EDITED,
+    NewsStatus.READY_FOR_FINAL,
+    NewsStatus.PUBLISHED_QUEUE,
+    NewsStatus.PUBLISHED,
+    name='news_status',
+    native_enum=True
+)
+
+# Statuses considered ready for publishing
+_READY_SET = frozenset((NewsStatus.PUBLISHED_QUEUE, NewsStatus.READY_FOR_FINAL))
 
 
 class News(Base):
@@ -42,35 +130,60 @@ class News(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Content fields
-    title = Column(String(500), nullable=False, index=True)
+    title = Column(String(500), nullable=False)
     highlight_text = Column(Text)
     url = Column(String(500), unique=True, nullable=False)
     
     # Metadata
     published = Column(DateTime, nullable=False, index=True)
     domain_rank = Column(Integer)
-    categories = Column(String(300))  # Comma-separated categories
+    categories = Column(JSON, default=list)  # List of category names
     sentiment = Column(String(50))
     language = Column(String(50), nullable=False, index=True)
     
     # Scoring and workflow
-    score = Column(Float, default=0.0, index=True)
-    status = Column(String(50), default=NewsStatus.COLLECTED, index=True)
+    # NOT NULL: keyset pagination compares (score, id) and NULL matches nothing
+    score = Column(Float, default=0.0, server_default=text("0"), nullable=False, index=True)
+    status = Column(STATUS_ENUM, default=NewsStatus.COLLECTED, index=True)
     
     # Translation fields
     translated_summary = Column(Text)
     edited_text = Column(Text)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # default= as well as server_default=: SQLite cannot change the DDL
+    # default of an existing table, so INSERTs supply the value themselves
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow(), nullable=False)
+    updated_at = Column(
+        DateTime, default=utcnow(), server_default=utcnow(), onupdate=utcnow(), nullable=False
+    )
     
     # Composite indexes for better query performance
     __table_args__ = (
         Index('idx_status_score', 'status', 'score'),
-        Index('idx_language_status', 'language', 'status'),
+        Index('idx_status_published', 'status', 'published'),
+        # List page: equality filters first, then the sort column, so the
+        # planner reads rows already in order and stops after the page
+        Index('idx_language_status_published', 'language', 'status', 'published'),
+        Index('idx_language_status_score', 'language', 'status', 'score'),
+        Index('idx_language_status_created', 'language', 'status', 'created_at'),
         Index('idx_published_status', 'published', 'status'),
         Index('idx_created_status', 'created_at', 'status'),
+        # Prefix index keeps title index pages small
+        Index('idx_title_prefix', func.substr(title, 1, 64)),
+        # Partial indexes: only the rows of one queue, already in pick order
+        Index(
+            'idx_translate_queue_score',
+            score.desc(),
+            postgresql_where=status == NewsStatus.APPROVED_FOR_TRANSLATE,
+            sqlite_where=status == NewsStatus.APPROVED_FOR_TRANSLATE
+        ),
+        Index(
+            'idx_publish_queue_published',
+            published.desc(),
+            postgresql_where=status == NewsStatus.PUBLISHED_QUEUE,
+            sqlite_where=status == NewsStatus.PUBLISHED_QUEUE
+        ),
     )
     
     def __repr__(self):
@@ -108,20 +221,13 @@ class News(Base):
     @property
     def is_ready_for_publish(self):
         """Check if news is ready for publishing"""
-        return self.status in [NewsStatus.PUBLISHED_QUEUE, NewsStatus.READY_FOR_FINAL]
+        return self.status in _READY_SET
     
     @property
     def is_published(self):
         """Check if news has been published"""
         return self.status == NewsStatus.PUBLISHED
     
-    @property
-    def categories_list(self):
-        """Get categories as list"""
-        if not self.categories:
-            return []
-        return [cat.strip() for cat in self.categories.split(',')]
-    
     def get_display_text(self):
         """
         Get the best available text for display
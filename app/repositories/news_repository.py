@@ -4,14 +4,119 @@ Separates data access logic from business logic
 Provides clean interface for database operations
 """
 import logging
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncMappingResult, AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy import func, and_, or_, desc, select, insert, update, delete, case, literal, literal_column, text, table, column, tuple_
 from datetime import datetime, date, timedelta
-from app.models.news import News, NewsStatus
+from app import database
+from app.models.news import News, NewsStatus, OrderBy
+from app.cache import cache, cached
 
 logger = logging.getLogger(__name__)
 
+# Columns returned by list endpoints (mirrors NewsResponse)
+LIST_COLUMNS = (
+    News.id,
+    News.title,
+    News.language,
+    News.published,
+    News.highlight_text,
+    News.status,
+    News.translated_summary,
+    News.edited_text,
+    News.score,
+    News.url,
+    News.domain_rank,
+    News.categories,
+    News.sentiment,
+    News.created_at,
+    News.updated_at,
+)
+
+# Column per sort field of list queries; ties are broken by id, so
+# (sort column, id) identifies a position for keyset pagination
+SORT_COLUMNS = {
+    OrderBy.published: News.published,
+    OrderBy.score: News.score,
+    OrderBy.created_at: News.created_at,
+}
+
+# Columns returned by search endpoints
+SEARCH_COLUMNS = (
+    News.id,
+    News.title,
+    News.language,
+    News.published,
+    News.highlight_text,
+    News.status,
+    News.translated_summary,
+    News.edited_text,
+    News.score,
+    News.url,
+)
+
+# Columns the Telegram message template needs
+PUBLISH_COLUMNS = (
+    News.id,
+    News.title,
+    News.edited_text,
+    News.translated_summary,
+    News.url,
+    News.updated_at,
+)
+
+# Highlight length kept in crawl summaries (one extra char marks truncation)
+SUMMARY_TEXT_LENGTH = 200
+
+# Cache namespace for aggregate statistics, cleared on every write
+STATS_CACHE = "news:stats"
+STATS_TTL = 30
+
+# SQLite FTS5 table (see create_sqlite_search_index); rank is bm25, lower is better
+NEWS_FTS = table("news_fts", column("rowid"), column("news_fts"), column("rank"))
+
+# Trigram indexes cannot serve patterns shorter than this
+MIN_TRIGRAM_QUERY = 3
+
+# Most ids bound into one IN (...) list (stays below driver parameter limits)
+MAX_IN_PARAMS = 10_000
+
+# A translating claim older than this belongs to a run that died
+TRANSLATION_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def _chunked(items: List, size: int) -> Iterator[List]:
+    """Split a list into consecutive slices of at most `size` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _search_document():
+    """
+    tsvector over the searchable text columns
+    Must stay identical to the news_fts index expression in
+    app/database.py, otherwise PostgreSQL will not use the index
+    """
+    empty = literal_column("''")
+    return func.to_tsvector(
+        literal_column("'simple'"),
+        func.coalesce(News.title, empty).op('||')(literal_column("' '"))
+        .op('||')(func.coalesce(News.highlight_text, empty))
+        .op('||')(literal_column("' '"))
+        .op('||')(func.coalesce(News.translated_summary, empty))
+    )
+
+
+def _fts5_query(query: str) -> str:
+    """
+    Quote every word of a user query for FTS5 MATCH
+    Words are ANDed like plainto_tsquery, and operators or punctuation in
+    the input are searched literally instead of being parsed
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
 
 class NewsRepository:
     """
@@ -32,20 +137,20 @@ class NewsRepository:
     # Create Operations
     # ============================================
     
-    def create(self, news: News) -> News:
+    def create(self, news: News, commit: bool = True) -> News:
         """
         Create a new news article
         
         Args:
             news: News object to create
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
             Created News object with ID
         """
         try:
             self.db.add(news)
-            self.db.commit()
-            self.db.refresh(news)
+            self._save(commit)  # Flush assigns news.id, no refresh needed
             logger.debug(f"➕ Created news ID {news.id}: {news.title[:50]}")
             return news
         except Exception as e:
@@ -53,22 +158,38 @@ class NewsRepository:
             logger.error(f"❌ Error creating news: {e}")
             raise
     
-    def bulk_create(self, news_list: List[News]) -> int:
+    def bulk_create(self, news_list: List[News], commit: bool = True) -> List[News]:
         """
         Create multiple news articles in bulk
+        One multi-row INSERT ... RETURNING instead of a round trip per article
         
         Args:
             news_list: List of News objects
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
-            Number of created articles
+            Created News objects with IDs, in input order
         """
+        if not news_list:
+            return []
+        
+        # Plain dicts go through insertmanyvalues, which pages the INSERT
+        rows = [
+            {
+                column.name: getattr(news, column.name)
+                for column in News.__table__.columns
+                if getattr(news, column.name) is not None
+            }
+            for news in news_list
+        ]
+        
         try:
-            self.db.bulk_save_objects(news_list)
-            self.db.commit()
-            count = len(news_list)
-            logger.info(f"➕ Bulk created {count} news articles")
-            return count
+            created = self.db.scalars(
+                insert(News).returning(News, sort_by_parameter_order=True), rows
+            ).all()
+            self._save(commit)
+            logger.info(f"➕ Bulk created {len(created)} news articles")
+            return created
         except Exception as e:
             self.db.rollback()
             logger.error(f"❌ Error bulk creating news: {e}")
@@ -90,6 +211,82 @@ class NewsRepository:
         """
         return self.db.query(News).filter(News.id == news_id).first()
     
+    def get_updated_at(self, news_id: int) -> Optional[datetime]:
+        """
+        Get the last modification time of a news (cheap freshness check)
+        
+        Args:
+            news_id: News ID
+            
+        Returns:
+            updated_at value or None if not found
+        """
+        return self.db.execute(
+            select(News.updated_at).where(News.id == news_id)
+        ).scalar()
+    
+    def get_by_ids(self, news_ids: List[int]) -> List[News]:
+        """
+        Get several news by ID in one query
+        
+        Args:
+            news_ids: List of news IDs
+            
+        Returns:
+            List of found News objects (missing IDs are skipped)
+        """
+        if not news_ids:
+            return []
+        return self.db.query(News).filter(News.id.in_(news_ids)).all()
+    
+    def get_publish_payload(self, news_id: int) -> Optional[RowMapping]:
+        """
+        Get the fields needed to publish a news
+        Selects PUBLISH_COLUMNS only, without loading the ORM object
+        
+        Args:
+            news_id: News ID
+            
+        Returns:
+            Row mapping (PUBLISH_COLUMNS) or None if not found
+        """
+        return self.db.execute(
+            select(*PUBLISH_COLUMNS).where(News.id == news_id)
+        ).mappings().first()
+    
+    def get_publish_payloads(self, news_ids: List[int]) -> List[RowMapping]:
+        """
+        Get the publish fields of several translated news in one query
+        
+        Args:
+            news_ids: List of news IDs
+            
+        Returns:
+            Row mappings (PUBLISH_COLUMNS); missing or untranslated news are skipped
+        """
+        if not news_ids:
+            return []
+        return self.db.execute(
+            select(*PUBLISH_COLUMNS).where(
+                News.id.in_(news_ids),
+                or_(News.edited_text.isnot(None), News.translated_summary.isnot(None))
+            )
+        ).mappings().all()
+    
+    def get_translation_source(self, news_id: int) -> Optional[Row]:
+        """
+        Get only the fields needed to translate a news
+        
+        Args:
+            news_id: News ID
+            
+        Returns:
+            Row with id, title and highlight_text, or None if not found
+        """
+        return self.db.execute(
+            select(News.id, News.title, News.highlight_text).where(News.id == news_id)
+        ).first()
+    
     def get_by_url(self, url: str) -> Optional[News]:
         """
         Get news by URL (useful for duplicate checking)
@@ -125,26 +322,153 @@ class NewsRepository:
         Returns:
             List of News objects
         """
-        query = self.db.query(News)
+        query = self.db.query(News).filter(
+            *self._list_filters(language, status, date_filter)
+        ).order_by(*self._list_order(order_by))
+        
+        # Apply pagination
+        return query.limit(limit).offset(offset).all()
+    
+    def list_as_dicts(
+        self, 
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        date_filter: Optional[date] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published",
+        after: Optional[Tuple[Any, int]] = None
+    ) -> List[dict]:
+        """
+        Get all news with optional filters as plain dictionaries
+        Selects columns directly, skipping ORM object hydration
+        
+        Args:
+            Same as get_all, plus
+            after: Keyset position (sort value, id); only rows past it are
+                returned, which stays O(limit) where a large offset does not
+            
+        Returns:
+            List of row mappings (column name -> value)
+        """
+        stmt = self.list_statement(language, status, date_filter, limit, offset, order_by, after)
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
+    
+    def list_page_end(
+        self,
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        date_filter: Optional[date] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published",
+        after: Optional[Tuple[Any, int]] = None
+    ) -> Optional[Row]:
+        """
+        Get the keyset position of the last row of a list page
+        Reads only the sort column and id, so the page itself is not loaded
+        
+        Args:
+            Same as list_as_dicts
+            
+        Returns:
+            Row of (sort value, id), or None if the page is not full
+        """
+        stmt = self.list_statement(
+            language, status, date_filter, 1, offset + limit - 1, order_by, after
+        ).with_only_columns(self._sort_column(order_by), News.id)
+        return self.db.execute(stmt).first()
+    
+    @classmethod
+    def list_statement(
+        cls,
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        date_filter: Optional[date] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "published",
+        after: Optional[Tuple[Any, int]] = None
+    ):
+        """
+        Build the SELECT behind list_as_dicts (LIST_COLUMNS)
         
-        # Apply filters
+        Args:
+            Same as list_as_dicts
+            
+        Returns:
+            SQLAlchemy select statement
+        """
+        filters = cls._list_filters(language, status, date_filter)
+        if after is not None:
+            filters.append(tuple_(cls._sort_column(order_by), News.id) < tuple_(*after))
+        
+        return select(*LIST_COLUMNS).where(
+            *filters
+        ).order_by(*cls._list_order(order_by)).limit(limit).offset(offset)
+    
+    @staticmethod
+    def _list_filters(
+        language: Optional[str],
+        status: Optional[str],
+        date_filter: Optional[date]
+    ) -> list:
+        """Build WHERE conditions for list queries"""
+        filters = []
         if language:
-            query = query.filter(News.language == language)
+            filters.append(News.language == language)
         if status:
-            query = query.filter(News.status == status)
+            filters.append(News.status == status)
         if date_filter:
-            query = query.filter(func.date(News.published) == date_filter)
+            # Range instead of date(published) so the published index is usable
+            start = datetime.combine(date_filter, datetime.min.time())
+            filters.append(News.published >= start)
+            filters.append(News.published < start + timedelta(days=1))
+        return filters
+    
+    @staticmethod
+    def _sort_column(order_by: str):
+        """Get the column a list query is sorted by"""
+        return SORT_COLUMNS.get(order_by, News.published)
+    
+    @classmethod
+    def _list_order(cls, order_by: str) -> tuple:
+        """Build ORDER BY clauses for list queries (newest/highest first)"""
+        return desc(cls._sort_column(order_by)), desc(News.id)
+    
+    def iter_summaries(self, news_ids: List[int], batch_size: int = 200) -> Iterator[Row]:
+        """
+        Stream short news summaries by IDs, newest first
+        Only the needed columns are selected and highlight_text is cut in
+        SQL; rows are fetched in batches instead of all at once
         
-        # Apply ordering
-        if order_by == "score":
-            query = query.order_by(desc(News.score))
-        elif order_by == "created_at":
-            query = query.order_by(desc(News.created_at))
-        else:  # Default: published
-            query = query.order_by(desc(News.published))
+        Args:
+            news_ids: News IDs to load
+            batch_size: Rows fetched per round-trip
+            
+        Yields:
+            Rows with id, title, language, published, highlight_text,
+            status, score and url
+        """
+        if not news_ids:
+            return
         
-        # Apply pagination
-        return query.limit(limit).offset(offset).all()
+        stmt = select(
+            News.id,
+            News.title,
+            News.language,
+            News.published,
+            func.substr(
+                News.highlight_text, 1, SUMMARY_TEXT_LENGTH + 1
+            ).label("highlight_text"),
+            News.status,
+            News.score,
+            News.url
+        ).where(
+            News.id.in_(news_ids)
+        ).order_by(desc(News.published)).execution_options(yield_per=batch_size)
+        
+        yield from self.db.execute(stmt)
     
     def get_by_status(self, status: str, limit: int = 100) -> List[News]:
         """
@@ -175,6 +499,91 @@ class NewsRepository:
             News.status == NewsStatus.APPROVED_FOR_TRANSLATE
         ).order_by(desc(News.score)).limit(limit).all()
     
+    def claim_for_translation(
+        self, 
+        limit: int = 10, 
+        news_id: Optional[int] = None, 
+        commit: bool = True
+    ) -> List[Row]:
+        """
+        Claim news awaiting translation by moving them to translating
+        The status check is part of the UPDATE, so two concurrent runs
+        never claim the same news
+        
+        Args:
+            limit: Maximum news to claim, highest score first
+            news_id: Only claim this news
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            Rows with id, title and highlight_text of the claimed news
+        """
+        ids = select(News.id).where(News.status == NewsStatus.APPROVED_FOR_TRANSLATE)
+        if news_id is not None:
+            ids = ids.where(News.id == news_id)
+        ids = ids.order_by(desc(News.score)).limit(limit)
+        
+        try:
+            rows = self.db.execute(
+                update(News)
+                .where(
+                    News.id.in_(ids),
+                    News.status == NewsStatus.APPROVED_FOR_TRANSLATE
+                )
+                .values(status=NewsStatus.TRANSLATING)
+                .returning(News.id, News.title, News.highlight_text)
+                .execution_options(synchronize_session=False)
+            ).all()
+            self._save(commit)
+            return rows
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error claiming news for translation: {e}")
+            return []
+    
+    def release_translation_claims(
+        self, 
+        news_ids: Optional[List[int]] = None, 
+        older_than: Optional[timedelta] = None, 
+        commit: bool = True
+    ) -> int:
+        """
+        Hand claimed news back to approved_for_translate for a retry
+        
+        Args:
+            news_ids: Release these news
+            older_than: Release claims not touched for this long (crashed runs)
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            Number of released records
+        """
+        criteria = [News.status == NewsStatus.TRANSLATING]
+        if news_ids is not None:
+            if not news_ids:
+                return 0
+            criteria.append(News.id.in_(news_ids))
+        if older_than is not None:
+            criteria.append(News.updated_at < datetime.utcnow() - older_than)
+        
+        try:
+            count = self.db.execute(
+                update(News)
+                .where(*criteria)
+                .values(status=NewsStatus.APPROVED_FOR_TRANSLATE)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            self._save(commit)
+            if count:
+                logger.info(f"🔄 Released {count} translation claims")
+            return count
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error releasing translation claims: {e}")
+            return 0
+    
     def get_for_publishing(self, limit: int = 10) -> List[News]:
         """
         Get news ready for publishing
@@ -189,19 +598,38 @@ class NewsRepository:
             News.status == NewsStatus.PUBLISHED_QUEUE
         ).order_by(desc(News.published)).limit(limit).all()
     
-    def get_recent_for_duplicate_check(self, days: int = 7) -> List[News]:
+    def get_one_for_publishing_random(self) -> Optional[RowMapping]:
+        """
+        Get one random news from the publishing queue
+        The random pick happens in SQL so only one row is loaded
+        
+        Returns:
+            Row mapping (PUBLISH_COLUMNS) of a queued news or None
+        """
+        return self.db.execute(
+            select(*PUBLISH_COLUMNS).where(
+                News.status == NewsStatus.PUBLISHED_QUEUE
+            ).order_by(func.random()).limit(1)
+        ).mappings().first()
+    
+    def get_recent_for_duplicate_check(self, days: int = 7) -> List[Row]:
         """
         Get recent news for duplicate checking
+        Only the compared fields are selected (highlight cut to 200 chars)
         
         Args:
             days: Number of days to look back
             
         Returns:
-            List of recent News objects
+            List of rows with url, title and highlight_text
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        return self.db.query(News).filter(
-            News.published >= cutoff_date
+        return self.db.execute(
+            select(
+                News.url,
+                News.title,
+                func.substr(News.highlight_text, 1, 200).label("highlight_text")
+            ).where(News.published >= cutoff_date)
         ).all()
     
     def get_high_score_news(self, threshold: float = 0.7, limit: int = 20) -> List[News]:
@@ -224,7 +652,7 @@ class NewsRepository:
         query: str, 
         language: Optional[str] = None,
         limit: int = 50
-    ) -> List[News]:
+    ) -> List[Row]:
         """
         Search news by title or content
         
@@ -234,48 +662,109 @@ class NewsRepository:
             limit: Maximum results
             
         Returns:
-            List of matching News objects
+            List of matching rows (SEARCH_COLUMNS)
         """
-        search_filter = or_(
-            News.title.ilike(f"%{query}%"),
-            News.highlight_text.ilike(f"%{query}%"),
-            News.translated_summary.ilike(f"%{query}%")
-        )
+        if self._is_postgres() and len(query.strip()) < MIN_TRIGRAM_QUERY:
+            # Too short for trigrams, match whole words instead
+            search_filter = _search_document().op('@@')(
+                func.plainto_tsquery(literal_column("'simple'"), query)
+            )
+        else:
+            search_filter = or_(
+                News.title.ilike(f"%{query}%"),
+                News.highlight_text.ilike(f"%{query}%"),
+                News.translated_summary.ilike(f"%{query}%")
+            )
         
         if language:
             search_filter = and_(search_filter, News.language == language)
         
-        return self.db.query(News).filter(
-            search_filter
-        ).order_by(desc(News.score)).limit(limit).all()
+        return self.db.execute(
+            select(*SEARCH_COLUMNS).where(
+                search_filter
+            ).order_by(desc(News.score)).limit(limit)
+        ).all()
+    
+    def search_fts(
+        self, 
+        query: str, 
+        language: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Row]:
+        """
+        Full-text search ranked by relevance
+        Uses the news_fts index on PostgreSQL and the FTS5 table on SQLite,
+        falls back to search() elsewhere
+        
+        Args:
+            query: Search query string
+            language: Optional language filter
+            limit: Maximum results
+            
+        Returns:
+            List of matching rows (SEARCH_COLUMNS), best match first
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite" and database.SQLITE_FTS:
+            return self._search_fts5(query, language, limit)
+        if dialect != "postgresql":
+            return self.search(query, language, limit)
+        
+        document = _search_document()
+        tsquery = func.plainto_tsquery(literal_column("'simple'"), query)
+        
+        search_filter = document.op('@@')(tsquery)
+        if language:
+            search_filter = and_(search_filter, News.language == language)
+        
+        return self.db.execute(
+            select(*SEARCH_COLUMNS).where(
+                search_filter
+            ).order_by(desc(func.ts_rank_cd(document, tsquery))).limit(limit)
+        ).all()
+    
+    def _search_fts5(self, query: str, language: Optional[str], limit: int) -> List[Row]:
+        """SQLite branch of search_fts(): MATCH against news_fts, best bm25 first"""
+        match = _fts5_query(query)
+        if not match:
+            return []
+        
+        search_filter = NEWS_FTS.c.news_fts.op('MATCH')(match)
+        if language:
+            search_filter = and_(search_filter, News.language == language)
+        
+        return self.db.execute(
+            select(*SEARCH_COLUMNS).join(
+                NEWS_FTS, NEWS_FTS.c.rowid == News.id
+            ).where(
+                search_filter
+            ).order_by(NEWS_FTS.c.rank).limit(limit)
+        ).all()
     
     # ============================================
     # Update Operations
     # ============================================
     
-    def update(self, news_id: int, **kwargs) -> bool:
+    def update(self, news_id: int, commit: bool = True, **kwargs) -> bool:
         """
         Update news fields
         
         Args:
             news_id: News ID
+            commit: Commit now; False leaves it to the caller (see commit())
             **kwargs: Fields to update
             
         Returns:
             True if updated successfully
         """
         try:
-            news = self.get_by_id(news_id)
-            if not news:
+            columns = News.__table__.columns
+            values = {key: value for key, value in kwargs.items() if key in columns}
+            
+            if not self._update_by_id(news_id, commit, **values):
                 logger.warning(f"⚠️ News ID {news_id} not found for update")
                 return False
             
-            for key, value in kwargs.items():
-                if hasattr(news, key):
-                    setattr(news, key, value)
-            
-            news.updated_at = datetime.utcnow()
-            self.db.commit()
             logger.debug(f"✏️ Updated news ID {news_id}")
             return True
             
@@ -284,29 +773,24 @@ class NewsRepository:
             logger.error(f"❌ Error updating news ID {news_id}: {e}")
             return False
     
-    def update_status(self, news_id: int, status: str) -> bool:
+    def update_status(self, news_id: int, status: str, commit: bool = True) -> bool:
         """
         Update news status
         
         Args:
             news_id: News ID
             status: New status
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
             True if updated successfully
         """
         try:
-            news = self.get_by_id(news_id)
-            if not news:
+            if not self._update_by_id(news_id, commit, status=status):
                 logger.warning(f"⚠️ News ID {news_id} not found")
                 return False
             
-            old_status = news.status
-            news.status = status
-            news.updated_at = datetime.utcnow()
-            self.db.commit()
-            
-            logger.info(f"📝 News ID {news_id}: {old_status} → {status}")
+            logger.info(f"📝 News ID {news_id} → {status}")
             return True
             
         except Exception as e:
@@ -318,31 +802,36 @@ class NewsRepository:
         self, 
         news_id: int, 
         translated_summary: str, 
-        edited_text: str
+        edited_text: str,
+        commit: bool = True
     ) -> bool:
         """
-        Update news translation
+        Store the translation of a news claimed with claim_for_translation()
+        Only a news still in translating is updated, so a run whose claim
+        was released or already handled cannot overwrite newer data
         
         Args:
             news_id: News ID
             translated_summary: Translated summary text
             edited_text: Edited text
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
-            True if updated successfully
+            True if updated, False if missing or already handled
         """
         try:
-            news = self.get_by_id(news_id)
-            if not news:
-                logger.warning(f"⚠️ News ID {news_id} not found")
+            updated = self._update_by_id(
+                news_id,
+                commit,
+                News.status == NewsStatus.TRANSLATING,
+                translated_summary=translated_summary,
+                edited_text=edited_text,
+                status=NewsStatus.READY_FOR_FINAL
+            )
+            if not updated:
+                logger.info(f"ℹ️ News ID {news_id} not claimed for translation, skipped")
                 return False
             
-            news.translated_summary = translated_summary
-            news.edited_text = edited_text
-            news.status = NewsStatus.READY_FOR_FINAL
-            news.updated_at = datetime.utcnow()
-            self.db.commit()
-            
             logger.info(f"🌐 Translation updated for news ID {news_id}")
             return True
             
@@ -351,28 +840,125 @@ class NewsRepository:
             logger.error(f"❌ Error updating translation for news ID {news_id}: {e}")
             return False
     
-    def bulk_update_status(self, news_ids: List[int], status: str) -> int:
+    def queue_if_translated(self, news_id: int, commit: bool = True) -> bool:
+        """
+        Move news to the publishing queue if it has a translation
+        The check and the update are one conditional UPDATE statement
+        
+        Args:
+            news_id: News ID
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            True if queued, False if missing or not translated yet
+        """
+        try:
+            result = self.db.execute(
+                update(News)
+                .where(
+                    News.id == news_id,
+                    or_(News.translated_summary.isnot(None), News.edited_text.isnot(None))
+                )
+                .values(status=NewsStatus.PUBLISHED_QUEUE)
+            )
+            self._save(commit)
+            return result.rowcount == 1
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error queueing news ID {news_id}: {e}")
+            return False
+    
+    def _update_by_id(self, news_id: int, commit: bool, *criteria, **values) -> bool:
+        """
+        Run a single UPDATE for one news and commit
+        No prior SELECT; a missing row simply matches nothing
+        updated_at is set by the column's onupdate
+        
+        Args:
+            news_id: News ID
+            commit: Commit now; False leaves it to the caller (see commit())
+            *criteria: Extra WHERE conditions the row must meet
+            **values: Column values to set
+            
+        Returns:
+            True if a row was updated
+        """
+        result = self.db.execute(
+            update(News).where(News.id == news_id, *criteria).values(**values)
+        )
+        self._save(commit)
+        return result.rowcount == 1
+    
+    def bulk_update_translations(
+        self, 
+        translations: Dict[int, Tuple[str, str]], 
+        commit: bool = True
+    ) -> int:
+        """
+        Bulk update translations for multiple news in one UPDATE statement
+        News no longer in translating (see update_translation) are skipped
+        
+        Args:
+            translations: Mapping of news ID to (translated_summary, edited_text)
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            Number of updated records
+        """
+        if not translations:
+            return 0
+        
+        try:
+            summaries = {news_id: t[0] for news_id, t in translations.items()}
+            edits = {news_id: t[1] for news_id, t in translations.items()}
+            
+            result = self.db.execute(
+                update(News)
+                .where(
+                    News.id.in_(list(translations)),
+                    News.status == NewsStatus.TRANSLATING
+                )
+                .values(
+                    translated_summary=case(summaries, value=News.id),
+                    edited_text=case(edits, value=News.id),
+                    status=NewsStatus.READY_FOR_FINAL
+                )
+                .execution_options(synchronize_session=False)
+            )
+            self._save(commit)
+            count = result.rowcount
+            logger.info(f"🌐 Bulk updated translations for {count} news")
+            return count
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error bulk updating translations: {e}")
+            return 0
+    
+    def bulk_update_status(self, news_ids: List[int], status: str, commit: bool = True) -> int:
         """
         Bulk update status for multiple news
         
         Args:
             news_ids: List of news IDs
             status: New status
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
             Number of updated records
         """
         try:
-            count = self.db.query(News).filter(
-                News.id.in_(news_ids)
-            ).update(
-                {
-                    News.status: status, 
-                    News.updated_at: datetime.utcnow()
-                },
-                synchronize_session=False
-            )
-            self.db.commit()
+            # One UPDATE per chunk of ids, all in the same transaction
+            count = 0
+            for chunk in _chunked(news_ids, MAX_IN_PARAMS):
+                count += self.db.execute(
+                    update(News)
+                    .where(News.id.in_(chunk))
+                    .values(status=status)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+            self._save(commit)
             logger.info(f"📝 Bulk updated {count} news to status: {status}")
             return count
             
@@ -381,29 +967,71 @@ class NewsRepository:
             logger.error(f"❌ Error bulk updating status: {e}")
             return 0
     
+    def move_status(
+        self, 
+        from_status: str, 
+        to_status: str, 
+        limit: int = 100, 
+        commit: bool = True
+    ) -> int:
+        """
+        Move up to `limit` news from one status to another
+        Highest-scored news are moved first, in a single UPDATE statement
+        
+        Args:
+            from_status: Current status
+            to_status: New status
+            limit: Maximum number of news to move
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            Number of updated records
+        """
+        try:
+            ids = select(News.id).where(
+                News.status == from_status
+            ).order_by(desc(News.score)).limit(limit)
+            
+            result = self.db.execute(
+                update(News)
+                .where(News.id.in_(ids))
+                .values(status=to_status)
+                .execution_options(synchronize_session=False)
+            )
+            self._save(commit)
+            count = result.rowcount
+            logger.info(f"📝 Moved {count} news: {from_status} → {to_status}")
+            return count
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error moving news from {from_status} to {to_status}: {e}")
+            return 0
+    
     # ============================================
     # Delete Operations
     # ============================================
     
-    def delete(self, news_id: int) -> bool:
+    def delete(self, news_id: int, commit: bool = True) -> bool:
         """
         Delete news (use with caution!)
         
         Args:
             news_id: News ID to delete
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
             True if deleted successfully
         """
         try:
-            news = self.get_by_id(news_id)
-            if not news:
+            result = self.db.execute(delete(News).where(News.id == news_id))
+            self._save(commit)
+            
+            if result.rowcount != 1:
                 logger.warning(f"⚠️ News ID {news_id} not found for deletion")
                 return False
             
-            self.db.delete(news)
-            self.db.commit()
-            logger.warning(f"🗑️ Deleted news ID {news_id}: {news.title[:50]}")
+            logger.warning(f"🗑️ Deleted news ID {news_id}")
             return True
             
         except Exception as e:
@@ -411,12 +1039,37 @@ class NewsRepository:
             logger.error(f"❌ Error deleting news ID {news_id}: {e}")
             return False
     
-    def bulk_delete(self, news_ids: List[int]) -> int:
+    def delete_returning(self, news_id: int, commit: bool = True) -> bool:
+        """
+        Delete news and report whether it existed, in one statement
+        Errors are raised, so "not found" is never confused with a failure
+        
+        Args:
+            news_id: News ID to delete
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            True if deleted, False if no such news
+        """
+        try:
+            deleted_id = self.db.execute(
+                delete(News).where(News.id == news_id).returning(News.id)
+            ).scalar()
+            self._save(commit)
+            return deleted_id is not None
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error deleting news ID {news_id}: {e}")
+            raise
+    
+    def bulk_delete(self, news_ids: List[int], commit: bool = True) -> int:
         """
         Bulk delete multiple news articles
         
         Args:
             news_ids: List of news IDs to delete
+            commit: Commit now; False leaves it to the caller (see commit())
             
         Returns:
             Number of deleted records
@@ -425,7 +1078,7 @@ class NewsRepository:
             count = self.db.query(News).filter(
                 News.id.in_(news_ids)
             ).delete(synchronize_session=False)
-            self.db.commit()
+            self._save(commit)
             logger.warning(f"🗑️ Bulk deleted {count} news articles")
             return count
             
@@ -434,10 +1087,69 @@ class NewsRepository:
             logger.error(f"❌ Error bulk deleting news: {e}")
             return 0
     
+    def count_older_than(self, status: str, cutoff: datetime) -> int:
+        """
+        Count news in a status published before a cutoff date
+        
+        Args:
+            status: News status
+            cutoff: Published date cutoff (exclusive)
+            
+        Returns:
+            Number of matching records
+        """
+        return self.db.execute(
+            select(func.count(News.id)).where(
+                News.status == status,
+                News.published < cutoff
+            )
+        ).scalar_one()
+    
+    def delete_older_than(
+        self, 
+        status: str, 
+        cutoff: datetime, 
+        limit: Optional[int] = None, 
+        commit: bool = True
+    ) -> int:
+        """
+        Delete news in a status published before a cutoff date
+        Runs as one DELETE statement, rows are never loaded
+        
+        Args:
+            status: News status
+            cutoff: Published date cutoff (exclusive)
+            limit: Maximum number of news to delete (None = all); callers
+                   deleting large backlogs loop over chunks to keep locks short
+            commit: Commit now; False leaves it to the caller (see commit())
+            
+        Returns:
+            Number of deleted records
+        """
+        try:
+            condition = and_(News.status == status, News.published < cutoff)
+            if limit is not None:
+                condition = News.id.in_(select(News.id).where(condition).limit(limit))
+            
+            # A chunk stuck behind another writer fails fast instead of waiting
+            if self._is_postgres():
+                self.db.execute(text("SET LOCAL lock_timeout = '5s'"))
+            
+            result = self.db.execute(delete(News).where(condition))
+            self._save(commit)
+            logger.warning(f"🗑️ Deleted {result.rowcount} {status} news older than {cutoff.date()}")
+            return result.rowcount
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Error deleting old news: {e}")
+            return 0
+    
     # ============================================
     # Statistics & Analytics
     # ============================================
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def count_total(self) -> int:
         """
         Count total news articles
@@ -447,6 +1159,7 @@ class NewsRepository:
         """
         return self.db.query(func.count(News.id)).scalar()
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def count_by_status(self) -> dict:
         """
         Count news by status
@@ -461,6 +1174,7 @@ class NewsRepository:
         
         return dict(result)
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def count_by_language(self) -> dict:
         """
         Count news by language
@@ -475,6 +1189,38 @@ class NewsRepository:
         
         return dict(result)
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
+    def get_all_counts(self) -> dict:
+        """
+        Count news in total, by status and by language in one query
+        
+        Returns:
+            Dictionary with total, by_status and by_language
+        """
+        by_status, by_language = self._count_by_status_and_language()
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "by_language": by_language
+        }
+    
+    def _count_by_status_and_language(self) -> Tuple[dict, dict]:
+        """
+        Count news by status and by language
+        One GROUP BY over both columns, pivoted here (SQLite has no GROUPING SETS)
+        """
+        by_status = {}
+        by_language = {}
+        for status, language, count in self.db.execute(
+            select(News.status, News.language, func.count(News.id))
+            .group_by(News.status, News.language)
+        ):
+            by_status[status] = by_status.get(status, 0) + count
+            by_language[language] = by_language.get(language, 0) + count
+        
+        return by_status, by_language
+    
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def get_average_score(self) -> float:
         """
         Get average score of all news
@@ -485,6 +1231,7 @@ class NewsRepository:
         avg = self.db.query(func.avg(News.score)).scalar()
         return round(float(avg), 3) if avg else 0.0
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def get_statistics(self) -> dict:
         """
         Get comprehensive statistics
@@ -492,14 +1239,25 @@ class NewsRepository:
         Returns:
             Dictionary with various statistics
         """
+        total, avg, high_score_count = self.db.execute(
+            select(
+                func.count(News.id),
+                func.avg(News.score),
+                func.coalesce(func.sum(case((News.score >= 0.7, 1), else_=0)), 0)
+            )
+        ).one()
+        
+        by_status, by_language = self._count_by_status_and_language()
+        
         return {
-            "total": self.count_total(),
-            "by_status": self.count_by_status(),
-            "by_language": self.count_by_language(),
-            "average_score": self.get_average_score(),
-            "high_score_count": len(self.get_high_score_news(threshold=0.7, limit=1000))
+            "total": total,
+            "by_status": by_status,
+            "by_language": by_language,
+            "average_score": round(float(avg), 3) if avg else 0.0,
+            "high_score_count": high_score_count
         }
     
+    @cached(ttl=STATS_TTL, namespace=STATS_CACHE)
     def get_today_stats(self) -> dict:
         """
         Get statistics for today's news
@@ -507,18 +1265,23 @@ class NewsRepository:
         Returns:
             Dictionary with today's statistics
         """
-        today = datetime.utcnow().date()
-        today_news = self.db.query(News).filter(
-            func.date(News.created_at) == today
+        start = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        rows = self.db.execute(
+            select(News.status, News.language, func.count(News.id))
+            .where(News.created_at >= start, News.created_at < start + timedelta(days=1))
+            .group_by(News.status, News.language)
         ).all()
         
+        by_status = dict.fromkeys(NewsStatus.ALL, 0)
+        by_language = {}
+        for status, language, count in rows:
+            by_status[status] = by_status.get(status, 0) + count
+            by_language[language] = by_language.get(language, 0) + count
+        
         return {
-            "total_today": len(today_news),
-            "by_status": {
-                status: len([n for n in today_news if n.status == status])
-                for status in NewsStatus.all_statuses()
-            },
-            "by_language": {}
+            "total_today": sum(by_language.values()),
+            "by_status": by_status,
+            "by_language": by_language
         }
     
     # ============================================
@@ -535,9 +1298,30 @@ class NewsRepository:
         Returns:
             True if exists
         """
-        return self.db.query(
-            self.db.query(News).filter(News.id == news_id).exists()
-        ).scalar()
+        return self.db.execute(
+            select(literal(1)).where(News.id == news_id).limit(1)
+        ).first() is not None
+    
+    def commit(self):
+        """Commit writes made with commit=False"""
+        self.db.commit()
+        self._invalidate_stats()
+    
+    def _save(self, commit: bool):
+        """Commit (or only flush) after a write"""
+        if commit:
+            self.commit()
+        else:
+            self.db.flush()
+    
+    @staticmethod
+    def _invalidate_stats():
+        """Drop cached statistics after a write"""
+        cache.invalidate(STATS_CACHE)
+    
+    def _is_postgres(self) -> bool:
+        """Check if the session is bound to PostgreSQL"""
+        return self.db.get_bind().dialect.name == "postgresql"
     
     def refresh(self, news: News) -> News:
         """
@@ -555,3 +1339,91 @@ class NewsRepository:
     def close(self):
         """Close database session"""
         self.db.close()
+
+
+class AsyncNewsRepository:
+    """
+    Async read access for request handlers
+    Runs the NewsRepository queries through AsyncSession.run_sync, so the
+    query code is shared while the I/O is awaited on the async driver
+    instead of blocking the event loop
+    """
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with async database session
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+    
+    async def _run(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a NewsRepository method on the session's sync facade"""
+        return await self.db.run_sync(
+            lambda session: method(NewsRepository(session), *args, **kwargs)
+        )
+    
+    async def get_by_id(self, news_id: int) -> Optional[News]:
+        """See NewsRepository.get_by_id"""
+        return await self._run(NewsRepository.get_by_id, news_id)
+    
+    async def get_updated_at(self, news_id: int) -> Optional[datetime]:
+        """See NewsRepository.get_updated_at"""
+        return await self._run(NewsRepository.get_updated_at, news_id)
+    
+    async def list_as_dicts(self, **filters) -> List[dict]:
+        """See NewsRepository.list_as_dicts"""
+        return await self._run(NewsRepository.list_as_dicts, **filters)
+    
+    async def stream_as_dicts(self, batch_size: int = 100, **filters) -> AsyncMappingResult:
+        """
+        Run the list_as_dicts query on a server-side cursor
+        Rows are fetched batch_size at a time while the caller iterates,
+        so the session must stay open until the result is consumed
+        
+        Args:
+            batch_size: Rows fetched per round trip
+            **filters: Same as NewsRepository.get_all
+            
+        Returns:
+            Async mapping result (iterate or use partitions())
+        """
+        stmt = NewsRepository.list_statement(**filters).execution_options(yield_per=batch_size)
+        return (await self.db.stream(stmt)).mappings()
+    
+    async def list_page_end(self, **filters) -> Optional[Row]:
+        """See NewsRepository.list_page_end"""
+        return await self._run(NewsRepository.list_page_end, **filters)
+    
+    async def search(self, query: str, language: Optional[str] = None, limit: int = 50) -> List[Row]:
+        """See NewsRepository.search"""
+        return await self._run(NewsRepository.search, query, language, limit)
+    
+    async def search_fts(self, query: str, language: Optional[str] = None, limit: int = 50) -> List[Row]:
+        """See NewsRepository.search_fts"""
+        return await self._run(NewsRepository.search_fts, query, language, limit)
+    
+    async def count_total(self) -> int:
+        """See NewsRepository.count_total"""
+        return await self._run(NewsRepository.count_total)
+    
+    async def count_by_status(self) -> dict:
+        """See NewsRepository.count_by_status"""
+        return await self._run(NewsRepository.count_by_status)
+    
+    async def count_by_language(self) -> dict:
+        """See NewsRepository.count_by_language"""
+        return await self._run(NewsRepository.count_by_language)
+    
+    async def get_all_counts(self) -> dict:
+        """See NewsRepository.get_all_counts"""
+        return await self._run(NewsRepository.get_all_counts)
+    
+    async def get_statistics(self) -> dict:
+        """See NewsRepository.get_statistics"""
+        return await self._run(NewsRepository.get_statistics)
+    
+    async def get_today_stats(self) -> dict:
+        """See NewsRepository.get_today_stats"""
+        return await self._run(NewsRepository.get_today_stats)
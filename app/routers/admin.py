@@ -2,12 +2,18 @@
 Admin routes
 Handles crawling, publishing, logs, and system operations
 """
+import asyncio
 import os
 import logging
-from typing import List
-from datetime import datetime
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import List, Literal
+from datetime import datetime, timedelta
+import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, PlainTextResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -25,6 +31,9 @@ from app.repositories.news_repository import NewsRepository
 from app.models.news import NewsStatus
 from app.dependencies import get_current_user
 from app.utils.logging import LogAnalyzer
+from app.utils.log_tail import tail_file, iter_lines_reversed, iter_tail_chunks, keep_tail
+from app.utils.static_pages import page_response
+from app.utils.clock import now_iso
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -37,54 +46,39 @@ router = APIRouter(prefix="/pnl7a3d", tags=["admin"])
 # ============================================
 
 @router.get("/dashboard", response_class=HTMLResponse)
-async def dashboard(current_user: str = Depends(get_current_user)):
+async def dashboard(
+    request: Request,
+    current_user: str = Depends(get_current_user)
+):
     """
     Serve dashboard page
     Main admin panel for news management
     """
-    try:
-        with open("static/dashboard.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        logger.error("❌ Dashboard page not found")
-        raise HTTPException(
-            status_code=500, 
-            detail="Dashboard page not found"
-        )
+    return page_response(request, "dashboard")
 
 
 @router.get("/advanced_crawl", response_class=HTMLResponse)
-async def advanced_crawl_page(current_user: str = Depends(get_current_user)):
+async def advanced_crawl_page(
+    request: Request,
+    current_user: str = Depends(get_current_user)
+):
     """
     Serve advanced crawl page
     Page for advanced crawler with date range and keywords
     """
-    try:
-        with open("static/advanced_crawl.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        logger.error("❌ Advanced crawl page not found")
-        raise HTTPException(
-            status_code=500, 
-            detail="Advanced crawl page not found"
-        )
+    return page_response(request, "advanced_crawl")
 
 
 @router.get("/logs_page", response_class=HTMLResponse)
-async def logs_page(current_user: str = Depends(get_current_user)):
+async def logs_page(
+    request: Request,
+    current_user: str = Depends(get_current_user)
+):
     """
     Serve logs page
     Page for viewing and managing system logs
     """
-    try:
-        with open("static/logs.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        logger.error("❌ Logs page not found")
-        raise HTTPException(
-            status_code=500, 
-            detail="Logs page not found"
-        )
+    return page_response(request, "logs")
 
 
 # ============================================
@@ -109,7 +103,7 @@ async def crawl_by_date(
             f"on {crawl_request.date} by {current_user}"
         )
         
-        news_list = async_crawler_service.crawl_news(
+        news_list = await async_crawler_service.crawl_news(
             db=db,
             language=crawl_request.language,
             specific_date=crawl_request.date,
@@ -177,7 +171,7 @@ async def advanced_crawl(
         if crawl_request.keywords:
             logger.info(f"🔍 Keywords: {crawl_request.keywords}")
         
-        news_list = async_crawler_service.advanced_crawl(
+        news_list = await async_crawler_service.advanced_crawl(
             db=db,
             date_from=date_from,
             date_to=date_to,
@@ -189,8 +183,8 @@ async def advanced_crawl(
         
         logger.info(f"✅ Advanced crawl completed: {len(news_list)} articles")
         
-        # Return detailed response
-        return {
+        # Stream NDJSON: a summary line, then one line per news
+        header = {
             "status": "success",
             "news_count": len(news_list),
             "date_range": {
@@ -198,13 +192,19 @@ async def advanced_crawl(
                 "to": crawl_request.date_to
             },
             "language": crawl_request.language,
-            "keywords": crawl_request.keywords,
-            "news": [
-                {
+            "keywords": crawl_request.keywords
+        }
+        news_ids = [n.id for n in news_list]
+        repo = NewsRepository(db)
+        
+        def generate():
+            yield orjson.dumps(header) + b"\n"
+            for n in repo.iter_summaries(news_ids):
+                yield orjson.dumps({
                     "id": n.id,
                     "title": n.title,
                     "language": n.language,
-                    "published": n.published.isoformat(),
+                    "published": n.published,
                     "highlight_text": (
                         n.highlight_text[:200] + "..." 
                         if n.highlight_text and len(n.highlight_text) > 200 
@@ -213,10 +213,9 @@ async def advanced_crawl(
                     "status": n.status,
                     "score": n.score,
                     "url": n.url
-                }
-                for n in news_list
-            ]
-        }
+                }) + b"\n"
+        
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
         
     except HTTPException:
         raise
@@ -244,54 +243,50 @@ async def trigger_publish_news(
     try:
         repo = NewsRepository(db)
         
-        # Get news ready for publishing
-        ready_news = repo.get_for_publishing(limit=10)
+        # Pick one random news from the queue (only that row is loaded)
+        news = repo.get_one_for_publishing_random()
         
-        if not ready_news:
-            # If no news in queue, check ready_for_final
-            ready_news = repo.get_by_status(NewsStatus.READY_FOR_FINAL, limit=5)
+        if news is None:
+            # If no news in queue, move the best ready_for_final news there
+            # in a single UPDATE (ids are selected in SQL, no rows loaded)
+            moved = repo.move_status(
+                NewsStatus.READY_FOR_FINAL,
+                NewsStatus.PUBLISHED_QUEUE,
+                limit=5
+            )
             
-            if ready_news:
-                # Move to queue
-                for news in ready_news:
-                    repo.update_status(news.id, NewsStatus.PUBLISHED_QUEUE)
-                
-                logger.info(f"📋 Moved {len(ready_news)} news to publishing queue")
+            if moved:
+                logger.info(f"📋 Moved {moved} news to publishing queue")
                 
                 return SuccessResponse(
                     status="success",
-                    message=f"Moved {len(ready_news)} news to publishing queue",
-                    data={"moved_to_queue": len(ready_news)}
+                    message=f"Moved {moved} news to publishing queue",
+                    data={"moved_to_queue": moved}
                 )
-        
-        if not ready_news:
+            
             logger.info("⚠️ No news available to publish")
             return SuccessResponse(
                 status="info",
                 message="No news available to publish"
             )
         
-        # Publish random news from queue
-        import random
-        news = random.choice(ready_news)
-        
         message = telegram_service.create_news_message(news)
-        success = telegram_service.send_message(message)
+        success = await telegram_service.async_send_message(message)
         
         if success:
-            repo.update_status(news.id, NewsStatus.PUBLISHED)
-            logger.info(f"✅ Published news ID {news.id}: {news.title[:50]}")
+            repo.update_status(news["id"], NewsStatus.PUBLISHED)
+            logger.info(f"✅ Published news ID {news['id']}: {news['title'][:50]}")
             
             return SuccessResponse(
                 status="success",
                 message=f"News published successfully",
                 data={
-                    "news_id": news.id,
-                    "title": news.title[:100]
+                    "news_id": news["id"],
+                    "title": news["title"][:100]
                 }
             )
         else:
-            logger.error(f"❌ Failed to publish news ID {news.id}")
+            logger.error(f"❌ Failed to publish news ID {news['id']}")
             raise HTTPException(
                 status_code=500, 
                 detail="Failed to publish to Telegram"
@@ -320,8 +315,8 @@ async def auto_translate_pending(
     try:
         repo = NewsRepository(db)
         
-        # Get news approved for translation
-        pending_news = repo.get_for_translation(limit=limit)
+        # Claim news approved for translation
+        pending_news = repo.claim_for_translation(limit=limit)
         
         if not pending_news:
             return SuccessResponse(
@@ -329,8 +324,8 @@ async def auto_translate_pending(
                 message="No news pending translation"
             )
         
-        translated_count = 0
-        failed_count = 0
+        translations = {}
+        failed_ids = []
         
         for news in pending_news:
             try:
@@ -338,17 +333,21 @@ async def auto_translate_pending(
                 translated = translation_service.translate(text_to_translate)
                 
                 if translated:
-                    repo.update_translation(news.id, translated, translated)
-                    translated_count += 1
+                    translations[news.id] = (translated, translated)
                     logger.info(f"✅ Translated news ID {news.id}")
                 else:
-                    failed_count += 1
+                    failed_ids.append(news.id)
                     logger.warning(f"⚠️ Translation failed for news ID {news.id}")
                     
             except Exception as e:
-                failed_count += 1
+                failed_ids.append(news.id)
                 logger.error(f"❌ Translation error for news ID {news.id}: {e}")
         
+        # Save all translations in a single UPDATE, failures go back to the queue
+        translated_count = repo.bulk_update_translations(translations)
+        repo.release_translation_claims(failed_ids)
+        failed_count = len(failed_ids)
+        
         logger.info(
             f"📊 Auto-translation completed: "
             f"{translated_count} success, {failed_count} failed"
@@ -376,29 +375,29 @@ async def auto_translate_pending(
 # FIXED: Logs Operations Section
 # ============================================
 
-@router.get("/logs")
+@router.get("/logs", response_class=PlainTextResponse)
 async def get_logs(current_user: str = Depends(get_current_user)):
     """
     Get recent logs (simple version)
-    Returns last 50 lines of log file
+    Streams last 50 lines of log file as plain text
     """
     try:
-        if not os.path.exists(settings.LOG_FILE):
-            return "Log file not found"
-        
-        with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-            logs = f.readlines()[-50:]  # ← FIXED: Get last 50 lines
-            return "".join(logs)
+        return StreamingResponse(
+            iter_tail_chunks(settings.LOG_FILE, 50),
+            media_type="text/plain; charset=utf-8"
+        )
         
+    except FileNotFoundError:
+        return PlainTextResponse("Log file not found", status_code=404)
     except Exception as e:
         logger.error(f"❌ Error reading logs: {e}")
-        return f"Error reading logs: {str(e)}"
+        return PlainTextResponse(f"Error reading logs: {str(e)}", status_code=500)
 
 
 @router.get("/logs_advanced")
 async def get_logs_advanced(
     lines: int = Query(50, ge=1, le=1000),
-    level: str = Query("all", regex="^(all|INFO|WARNING|ERROR)$"),
+    level: Literal["all", "INFO", "WARNING", "ERROR"] = Query("all"),
     search: str = Query("", max_length=200),
     current_user: str = Depends(get_current_user)
 ):
@@ -410,29 +409,31 @@ async def get_logs_advanced(
     - **search**: Search term to filter logs
     """
     try:
-        if not os.path.exists(settings.LOG_FILE):
-            return {
-                "logs": "Log file not found",
-                "stats": {}
-            }
-        
-        # Use LogAnalyzer for advanced features
-        analyzer = LogAnalyzer(settings.LOG_FILE)
-        
-        # Get filtered logs
+        # Get filtered logs, reading from the end of the file
         if search:
-            logs = analyzer.search_logs(search, max_lines=lines)
+            logs = LogAnalyzer.search_logs(search, limit=lines)
+        elif level == "all":
+            logs = tail_file(settings.LOG_FILE, lines)
         else:
-            logs = analyzer.get_recent_logs(lines=lines, level=level if level != "all" else None)
+            logs = list(islice(
+                (line for line in iter_lines_reversed(settings.LOG_FILE) if level in line),
+                lines
+            ))[::-1]
         
         # Get statistics
-        stats = analyzer.get_log_stats()
+        stats = LogAnalyzer.get_log_statistics()
         
-        return {
-            "logs": "\n".join(logs),
+        # Serialized by orjson directly (skips jsonable_encoder)
+        return ORJSONResponse({
+            "logs": "".join(logs),
             "stats": stats
-        }
+        })
         
+    except FileNotFoundError:
+        return {
+            "logs": "Log file not found",
+            "stats": {}
+        }
     except Exception as e:
         logger.error(f"❌ Error reading advanced logs: {e}")
         return {
@@ -452,20 +453,9 @@ async def clear_logs(
     - **keep_lines**: Number of recent lines to keep (0 to clear all)
     """
     try:
-        if not os.path.exists(settings.LOG_FILE):
-            return SuccessResponse(
-                status="info",
-                message="Log file does not exist"
-            )
-        
         if keep_lines > 0:
-            # Keep recent lines
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                keep = lines[-keep_lines:]
-            
-            with open(settings.LOG_FILE, "w", encoding="utf-8") as f:
-                f.writelines(keep)
+            # Keep recent lines (copies only the tail, in place)
+            keep_tail(settings.LOG_FILE, keep_lines)
             
             logger.warning(f"🗑️ Logs cleared, kept last {keep_lines} lines by {current_user}")
             
@@ -474,9 +464,8 @@ async def clear_logs(
                 message=f"Cleared logs, kept {keep_lines} recent lines"
             )
         else:
-            # Clear all
-            with open(settings.LOG_FILE, "w", encoding="utf-8") as f:
-                f.write("")
+            # Clear all (truncate fails instead of creating a missing file)
+            os.truncate(settings.LOG_FILE, 0)
             
             logger.warning(f"🗑️ All logs cleared by {current_user}")
             
@@ -485,6 +474,11 @@ async def clear_logs(
                 message="All logs cleared"
             )
         
+    except FileNotFoundError:
+        return SuccessResponse(
+            status="info",
+            message="Log file does not exist"
+        )
     except Exception as e:
         logger.error(f"❌ Error clearing logs: {e}")
         raise HTTPException(
@@ -493,78 +487,153 @@ async def clear_logs(
         )
 
 
+@router.get("/logs/raw")
+async def download_logs(
+    lines: int = Query(0, ge=0, le=100_000, description="Last N lines (0 = whole file)"),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Download raw log file (or its last lines) as an attachment
+    Bytes are sent as stored, never decoded or joined in Python
+    
+    - **lines**: Number of recent lines to send (0 for the whole file)
+    """
+    try:
+        stat_result = os.stat(settings.LOG_FILE)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Log file not found")
+    
+    filename = f"system_logs_{datetime.now():%Y-%m-%d}.log"
+    
+    if lines == 0:
+        return FileResponse(
+            settings.LOG_FILE,
+            media_type="text/plain; charset=utf-8",
+            filename=filename,
+            stat_result=stat_result
+        )
+    
+    return StreamingResponse(
+        iter_tail_chunks(settings.LOG_FILE, lines),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 # ============================================
 # FIXED: Test Connection Function
 # ============================================
 
+# Wall-clock deadlines (seconds) for a single probe and for the whole test
+PROBE_TIMEOUT = 8.0
+CONNECTION_TEST_TIMEOUT = 12.0
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """
+    Shared client for connection probes
+    Built on first use and kept, so repeated tests reuse keep-alive connections
+    """
+    return httpx.AsyncClient(timeout=10, proxies=settings.SOCKS5_PROXY or None)
+
+
+async def close_http_client():
+    """Close the shared probe client (call on application shutdown)"""
+    if _get_http_client.cache_info().currsize:
+        await _get_http_client().aclose()
+        _get_http_client.cache_clear()
+
+
+async def _probe_webz() -> bool:
+    """Check Webz.io API"""
+    keys = settings.webz_api_keys_list
+    response = await _get_http_client().get(
+        "https://api.webz.io/newsApiLite",
+        params={
+            "token": keys[0] if keys else "test",
+            "q": "test",
+            "language": "english",
+            "size": 1
+        }
+    )
+    return response.status_code == 200
+
+
+async def _probe_telegram() -> bool:
+    """Check Telegram bot API"""
+    return await telegram_service.async_test_connection()
+
+
+async def _probe_translation() -> bool:
+    """Check translation service"""
+    return bool(await asyncio.to_thread(translation_service.translate, "Hello", "fa"))
+
+
+async def _probe_gemini() -> bool:
+    """Check Gemini AI (skipped when no key is configured)"""
+    keys = settings.gemini_api_keys_list
+    if not keys:
+        return False
+    
+    response = await _get_http_client().post(
+        "https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent",
+        params={"key": keys[0]},
+        json={"contents": [{"parts": [{"text": "Say OK only"}]}]}
+    )
+    return response.status_code == 200
+
+
 @router.get("/test_connection")
 async def test_connection(current_user: str = Depends(get_current_user)):
     """
     Test connections to external services
     Tests: Webz.io, Telegram, Translation, Gemini AI
+    All probes run concurrently
     """
     try:
         logger.info("🔌 Testing connections to external services...")
         
-        # Test Webz.io
-        webz_status = False
+        # Each probe gets its own deadline, the whole test a hard upper bound
+        probes = {
+            "🌐 Webz.io": _probe_webz(),
+            "📱 Telegram": _probe_telegram(),
+            "🌐 Translation": _probe_translation(),
+            "🤖 Gemini AI": _probe_gemini(),
+        }
         try:
-            from app.utils.proxy import async_proxy_manager as proxy_manager
-            session = proxy_manager.create_session(timeout=10)
-            test_url = (
-                f"https://api.webz.io/newsApiLite?"
-                f"token={settings.WEBZ_API_KEYS[0] if settings.WEBZ_API_KEYS else 'test'}&"
-                f"q=test&language=english&size=1"
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(asyncio.wait_for(probe, PROBE_TIMEOUT) for probe in probes.values()),
+                    return_exceptions=True
+                ),
+                timeout=CONNECTION_TEST_TIMEOUT
             )
-            response = session.get(test_url, timeout=10)
-            webz_status = response.status_code == 200
-            logger.info(f"🌐 Webz.io: {'✅ OK' if webz_status else '❌ Failed'}")
-        except Exception as e:
-            logger.error(f"❌ Webz.io test failed: {e}")
-        
-        # Test Telegram
-        telegram_status = False
-        try:
-            telegram_status = telegram_service.test_connection()
-            logger.info(f"📱 Telegram: {'✅ OK' if telegram_status else '❌ Failed'}")
-        except Exception as e:
-            logger.error(f"❌ Telegram test failed: {e}")
-        
-        # Test Translation
-        translation_status = False
-        try:
-            test_text = translation_service.translate("Hello", "fa")
-            translation_status = bool(test_text)
-            logger.info(f"🌐 Translation: {'✅ OK' if translation_status else '❌ Failed'}")
-        except Exception as e:
-            logger.error(f"❌ Translation test failed: {e}")
-        
-        # Test Gemini AI
-        gemini_status = False
-        if settings.GEMINI_API_KEYS and settings.GEMINI_API_KEYS[0]:
-            try:
-                from app.utils.proxy import async_proxy_manager as proxy_manager
-                session = proxy_manager.create_session(timeout=10)
-                url = "https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent"
-                params = {"key": settings.GEMINI_API_KEYS[0]}
-                payload = {
-                    "contents": [{
-                        "parts": [{"text": "Say OK only"}]
-                    }]
-                }
-                response = session.post(url, params=params, json=payload, timeout=10)
-                gemini_status = response.status_code == 200
-                logger.info(f"🤖 Gemini AI: {'✅ OK' if gemini_status else '❌ Failed'}")
-            except Exception as e:
-                logger.error(f"❌ Gemini test failed: {e}")
-        
-        return ConnectionTestResponse(
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Connection test timed out after {CONNECTION_TEST_TIMEOUT}s")
+            results = [asyncio.TimeoutError()] * len(probes)
+        
+        statuses = []
+        for name, result in zip(probes, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(f"❌ {name} test timed out")
+                result = False
+            elif isinstance(result, Exception):
+                logger.error(f"❌ {name} test failed: {result}")
+                result = False
+            else:
+                logger.info(f"{name}: {'✅ OK' if result else '❌ Failed'}")
+            statuses.append(bool(result))
+        
+        webz_status, telegram_status, translation_status, gemini_status = statuses
+        
+        return ORJSONResponse(ConnectionTestResponse(
             webz_io=webz_status,
             telegram=telegram_status,
             translation=translation_status,
             gemini_ai=gemini_status,
-            timestamp=datetime.now().isoformat()
-        )
+            timestamp=now_iso()
+        ).model_dump())
         
     except Exception as e:
         logger.error(f"❌ Connection test error: {e}")
@@ -572,11 +641,16 @@ async def test_connection(current_user: str = Depends(get_current_user)):
             status_code=500, 
             detail="Connection test failed"
         )
-        
+
+
 # ============================================
 # Maintenance & Utilities
 # ============================================
 
+# Rows deleted per statement by cleanup_old_news
+CLEANUP_CHUNK_SIZE = 10_000
+
+
 @router.post("/cleanup_old_news")
 async def cleanup_old_news(
     days: int = Query(90, ge=30, le=365, description="Keep news newer than X days"),
@@ -591,19 +665,13 @@ async def cleanup_old_news(
     - **dry_run**: If true, only count without deleting
     """
     try:
-        from datetime import timedelta
-        
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Find old published news
-        old_news = db.query(News).filter(
-            News.status == NewsStatus.PUBLISHED,
-            News.published < cutoff_date
-        ).all()
-        
-        count = len(old_news)
+        repo = NewsRepository(db)
         
         if dry_run:
+            # Count old published news
+            count = repo.count_older_than(NewsStatus.PUBLISHED, cutoff_date)
+            
             logger.info(f"🔍 Dry run: Found {count} old news articles (>{days} days)")
             return SuccessResponse(
                 status="info",
@@ -611,14 +679,20 @@ async def cleanup_old_news(
                 data={
                     "count": count,
                     "dry_run": True,
-                    "cutoff_date": cutoff_date.isoformat()
+                    "cutoff_date": cutoff_date
                 }
             )
         else:
-            # Actually delete
-            repo = NewsRepository(db)
-            news_ids = [n.id for n in old_news]
-            deleted = repo.bulk_delete(news_ids)
+            # Actually delete in chunks, committing each one so locks stay short
+            deleted = 0
+            while True:
+                chunk = repo.delete_older_than(
+                    NewsStatus.PUBLISHED, cutoff_date, limit=CLEANUP_CHUNK_SIZE
+                )
+                deleted += chunk
+                if chunk < CLEANUP_CHUNK_SIZE:
+                    break
+                await asyncio.sleep(0)  # Let other requests run between chunks
             
             logger.warning(
                 f"🗑️ Deleted {deleted} old news articles (>{days} days) "
@@ -630,7 +704,7 @@ async def cleanup_old_news(
                 message=f"Deleted {deleted} old news articles",
                 data={
                     "deleted": deleted,
-                    "cutoff_date": cutoff_date.isoformat()
+                    "cutoff_date": cutoff_date
                 }
             )
         
@@ -642,90 +716,57 @@ async def cleanup_old_news(
         )
 
 
+# Static part of the health check response, only the timestamp changes
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","service":"News Management System",'
+    b'"version":"2.0.0","timestamp":"%s"}'
+)
+
+
 @router.get("/health")
 async def health_check():
     """
     Health check endpoint (no authentication required)
     Useful for monitoring and load balancers
     """
+    return Response(
+        content=_HEALTH_TEMPLATE % now_iso().encode(),
+        media_type="application/json"
+    )
+
+
+# /system_info payload is rebuilt at most once per TTL, however many
+# dashboards poll it
+SYSTEM_INFO_TTL = 5.0
+_system_info_cache = {"ts": 0.0, "value": None}
+_system_info_lock = asyncio.Lock()
+
+
+def _build_system_info(db: Session) -> dict:
+    """Collect crawler status and repository statistics"""
+    repo = NewsRepository(db)
+    
+    # Get crawler status
+    crawler_status = async_crawler_service.get_api_status()
+    
+    # Get repository stats
+    repo_stats = repo.get_statistics()
+    today_stats = repo.get_today_stats()
+    
     return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "News Management System",
-        "version": "2.0.0"
+        "system": {
+            "version": "2.0.0",
+            "environment": "production" if not settings.DEBUG else "development",
+            "uptime": "N/A"  # Can be implemented with process tracking
+        },
+        "crawler": crawler_status,
+        "statistics": {
+            **repo_stats,
+            "today": today_stats
+        },
+        "timestamp": now_iso()
     }
 
-async def test_connection(current_user: str = Depends(get_current_user)):
-    """
-    Test connections to external services
-    Tests: Webz.io, Telegram, Translation, Gemini AI
-    """
-    try:
-        logger.info("🔌 Testing connections to external services...")
-        
-        # Test Webz.io
-        webz_status = False
-        try:
-            from app.utils.proxy import async_proxy_manager as proxy_manager
-            session = proxy_manager.create_session(timeout=10)
-            test_url = (
-                f"https://api.webz.io/newsApiLite?"
-                f"token={settings.WEBZ_API_KEYS[0]}&q=test&"
-                f"ts={int(datetime.now().timestamp() * 1000)}"
-            )
-            response = session.get(test_url, timeout=10)
-            webz_status = response.status_code == 200
-            logger.info(f"📡 Webz.io: {'✅ OK' if webz_status else '❌ Failed'}")
-        except Exception as e:
-            logger.error(f"❌ Webz.io test failed: {e}")
-        
-        # Test Telegram
-        telegram_status = telegram_service.test_connection()
-        logger.info(f"📱 Telegram: {'✅ OK' if telegram_status else '❌ Failed'}")
-        
-        # Test Translation
-        translation_status = False
-        try:
-            test_text = translation_service.translate("Hello, this is a test.", "fa")
-            translation_status = bool(test_text)
-            logger.info(f"🌐 Translation: {'✅ OK' if translation_status else '❌ Failed'}")
-        except Exception as e:
-            logger.error(f"❌ Translation test failed: {e}")
-        
-        # Test Gemini AI
-        gemini_status = False
-        if settings.GEMINI_API_KEYS and settings.GEMINI_API_KEYS[0]:
-            try:
-                from app.utils.proxy import async_proxy_manager as proxy_manager
-                session = proxy_manager.create_session(timeout=10)
-                url = "https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent"
-                params = {"key": settings.GEMINI_API_KEYS[0]}
-                payload = {
-                    "contents": [{
-                        "parts": [{"text": "Say OK only"}]
-                    }]
-                }
-                response = session.post(url, params=params, json=payload, timeout=10)
-                gemini_status = response.status_code == 200
-                logger.info(f"🤖 Gemini AI: {'✅ OK' if gemini_status else '❌ Failed'}")
-            except Exception as e:
-                logger.error(f"❌ Gemini test failed: {e}")
-        
-        return ConnectionTestResponse(
-            webz_io=webz_status,
-            telegram=telegram_status,
-            translation=translation_status,
-            gemini_ai=gemini_status,
-            timestamp=datetime.now().isoformat()
-        )
-        
-    except Exception as e:
-        logger.error(f"❌ Connection test error: {e}")
-        raise HTTPException(
-            status_code=500, 
-            detail="Connection test failed"
-        )
-
 
 @router.get("/system_info")
 async def get_system_info(
@@ -734,30 +775,19 @@ async def get_system_info(
 ):
     """
     Get system information and statistics
+    Cached for a few seconds; concurrent misses share one rebuild
     """
     try:
-        repo = NewsRepository(db)
-        
-        # Get crawler status
-        crawler_status = async_crawler_service.get_api_status()
-        
-        # Get repository stats
-        repo_stats = repo.get_statistics()
-        today_stats = repo.get_today_stats()
-        
-        return {
-            "system": {
-                "version": "2.0.0",
-                "environment": "production" if not settings.DEBUG else "development",
-                "uptime": "N/A"  # Can be implemented with process tracking
-            },
-            "crawler": crawler_status,
-            "statistics": {
-                **repo_stats,
-                "today": today_stats
-            },
-            "timestamp": datetime.now().isoformat()
-        }
+        if time.monotonic() - _system_info_cache["ts"] >= SYSTEM_INFO_TTL:
+            async with _system_info_lock:
+                # Another request may have refreshed it while we waited
+                if time.monotonic() - _system_info_cache["ts"] >= SYSTEM_INFO_TTL:
+                    # Queries share one session, so they run in one worker thread
+                    _system_info_cache["value"] = await asyncio.to_thread(_build_system_info, db)
+                    _system_info_cache["ts"] = time.monotonic()
+        
+        # Plain dict, serialized by orjson directly (skips jsonable_encoder)
+        return ORJSONResponse(_system_info_cache["value"])
         
     except Exception as e:
         logger.error(f"❌ System info error: {e}")
@@ -3,42 +3,47 @@ Authentication router
 Handles login, logout, and session management routes
 """
 from fastapi import APIRouter, Request, Response, HTTPException, Cookie
-from fastapi.responses import RedirectResponse, FileResponse
+from fastapi.responses import RedirectResponse
 from typing import Optional
 from app.config import settings
 from app.schemas.news import AuthRequest
 from app.services.auth import auth_service
+from app.dependencies import forget_session
+from app.utils.static_pages import page_response
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Create router instance - این خط خیلی مهمه!
-router = APIRouter()
+# The secret path is part of the route itself: requests with any other
+# prefix never match and get the default 404
+router = APIRouter(prefix=f"/{settings.SECRET_PATH}")
 
+_LOGIN_URL = f"/{settings.SECRET_PATH}/"
+_DASHBOARD_URL = f"/{settings.SECRET_PATH}/dashboard"
 
-@router.get("/{secret_path}/")
-async def login_page(secret_path: str, request: Request):
+# The two possible /verify-session bodies, serialized once
+_SESSION_VALID = b'{"valid":true,"message":"Session is valid"}'
+_SESSION_INVALID = b'{"valid":false,"message":"Session is invalid or expired"}'
+
+
+@router.get("/")
+async def login_page(request: Request):
     """
     Serve login page
     
     Args:
-        secret_path: Secret path segment for security
         request: FastAPI request object
         
     Returns:
         Login page HTML
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Serve login page
-    return FileResponse("static/index.html")
+    return page_response(request, "index")
 
 
-@router.post("/{secret_path}/login")
+@router.post("/login")
 async def login(
-    secret_path: str,
     auth_request: AuthRequest,
     response: Response
 ):
@@ -46,19 +51,14 @@ async def login(
     Handle login request
     
     Args:
-        secret_path: Secret path segment
         auth_request: Login credentials
         response: FastAPI response object
         
     Returns:
         Redirect to dashboard on success
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Authenticate user
-    if not auth_service.authenticate(
+    if not await auth_service.authenticate_async(
         auth_request.username,
         auth_request.password
     ):
@@ -72,7 +72,7 @@ async def login(
     
     # Redirect to dashboard with session cookie
     redirect_response = RedirectResponse(
-        url=f"/{settings.SECRET_PATH}/dashboard",
+        url=_DASHBOARD_URL,
         status_code=303
     )
     redirect_response.set_cookie(
@@ -87,9 +87,8 @@ async def login(
     return redirect_response
 
 
-@router.get("/{secret_path}/dashboard")
+@router.get("/dashboard")
 async def dashboard_page(
-    secret_path: str,
     request: Request,
     session_token: Optional[str] = Cookie(None)
 ):
@@ -97,29 +96,23 @@ async def dashboard_page(
     Serve dashboard page
     
     Args:
-        secret_path: Secret path segment
         request: FastAPI request object
         session_token: Session token from cookie
         
     Returns:
         Dashboard HTML page
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Verify session
     if not session_token or not auth_service.verify_session(session_token):
         logger.warning("⚠️ Unauthorized dashboard access attempt")
-        return RedirectResponse(url=f"/{settings.SECRET_PATH}/", status_code=303)
+        return RedirectResponse(url=_LOGIN_URL, status_code=303)
     
     # Serve dashboard HTML
-    return FileResponse("static/dashboard.html")
+    return page_response(request, "dashboard")
 
 
-@router.get("/{secret_path}/advanced_crawl")
+@router.get("/advanced_crawl")
 async def advanced_crawl_page(
-    secret_path: str,
     request: Request,
     session_token: Optional[str] = Cookie(None)
 ):
@@ -127,29 +120,23 @@ async def advanced_crawl_page(
     Serve advanced crawl page
     
     Args:
-        secret_path: Secret path segment
         request: FastAPI request object
         session_token: Session token from cookie
         
     Returns:
         Advanced crawl HTML page
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Verify session
     if not session_token or not auth_service.verify_session(session_token):
         logger.warning("⚠️ Unauthorized advanced_crawl access attempt")
-        return RedirectResponse(url=f"/{settings.SECRET_PATH}/", status_code=303)
+        return RedirectResponse(url=_LOGIN_URL, status_code=303)
     
     # Serve advanced crawl HTML
-    return FileResponse("static/advanced_crawl.html")
+    return page_response(request, "advanced_crawl")
 
 
-@router.get("/{secret_path}/logs")
+@router.get("/logs")
 async def logs_page(
-    secret_path: str,
     request: Request,
     session_token: Optional[str] = Cookie(None)
 ):
@@ -157,29 +144,23 @@ async def logs_page(
     Serve logs page
     
     Args:
-        secret_path: Secret path segment
         request: FastAPI request object
         session_token: Session token from cookie
         
     Returns:
         Logs HTML page
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Verify session
     if not session_token or not auth_service.verify_session(session_token):
         logger.warning("⚠️ Unauthorized logs access attempt")
-        return RedirectResponse(url=f"/{settings.SECRET_PATH}/", status_code=303)
+        return RedirectResponse(url=_LOGIN_URL, status_code=303)
     
     # Serve logs HTML
-    return FileResponse("static/logs.html")
+    return page_response(request, "logs")
 
 
-@router.post("/{secret_path}/logout")
+@router.post("/logout")
 async def logout(
-    secret_path: str,
     response: Response,
     session_token: Optional[str] = Cookie(None)
 ):
@@ -187,25 +168,21 @@ async def logout(
     Handle logout request
     
     Args:
-        secret_path: Secret path segment
         response: FastAPI response object
         session_token: Session token from cookie
         
     Returns:
         Redirect to login page
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Delete session
     if session_token:
         auth_service.delete_session(session_token)
+        forget_session(session_token)
         logger.info("👋 User logged out")
     
     # Redirect to login page and clear cookie
     redirect_response = RedirectResponse(
-        url=f"/{settings.SECRET_PATH}/",
+        url=_LOGIN_URL,
         status_code=303
     )
     redirect_response.delete_cookie(key="session_token")
@@ -213,31 +190,25 @@ async def logout(
     return redirect_response
 
 
-@router.get("/{secret_path}/verify-session")
+@router.get("/verify-session")
 async def verify_session_endpoint(
-    secret_path: str,
     session_token: Optional[str] = Cookie(None)
 ):
     """
     Verify if session is valid (API endpoint)
     
     Args:
-        secret_path: Secret path segment
         session_token: Session token from cookie
         
     Returns:
         JSON with session validity status
     """
-    # Verify secret path
-    if secret_path != settings.SECRET_PATH:
-        raise HTTPException(status_code=404, detail="Not found")
-    
     # Check session
     is_valid = False
     if session_token:
         is_valid = auth_service.verify_session(session_token)
     
-    return {
-        "valid": is_valid,
-        "message": "Session is valid" if is_valid else "Session is invalid or expired"
-    }
\ No newline at end of file
+    return Response(
+        content=_SESSION_VALID if is_valid else _SESSION_INVALID,
+        media_type="application/json"
+    )
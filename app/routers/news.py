@@ -2,13 +2,20 @@
 News API routes
 Handles news CRUD operations and workflow management
 """
+import asyncio
+import base64
+import hashlib
 import logging
-from typing import Optional, List
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, AsyncIterator, Optional, List, Tuple
+from datetime import datetime, timezone
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncMappingResult, AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import AsyncSessionLocal, SessionLocal, get_db, get_async_db
 from app.schemas.news import (
     NewsResponse, 
     StatsResponse, 
@@ -16,16 +23,111 @@ from app.schemas.news import (
     SuccessResponse,
     ErrorResponse
 )
-from app.repositories.news_repository import NewsRepository
+from app.repositories.news_repository import NewsRepository, AsyncNewsRepository
 from app.services.translator import translation_service
 from app.services.telegram import telegram_service
-from app.models.news import NewsStatus
+from app.models.news import NewsStatus, OrderBy, StatusFilter
 from app.dependencies import get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["news"])
 
+# Response fields, in NewsResponse order
+NEWS_FIELDS = tuple(NewsResponse.model_fields)
+
+
+def _to_resp(news) -> dict:
+    """
+    Build a NewsResponse-shaped dict from an ORM object or row
+    Values come straight from the database, so pydantic validation is
+    skipped; fields a row does not carry are None
+    """
+    return {name: getattr(news, name, None) for name in NEWS_FIELDS}
+
+
+# Larger pages are streamed from a server-side cursor instead of buffered
+STREAM_MIN_LIMIT = 50
+STREAM_BATCH_SIZE = 100
+
+
+async def _json_stream(result: AsyncMappingResult) -> AsyncIterator[bytes]:
+    """Encode a row stream as a JSON array, one chunk per fetched batch"""
+    separator = b"["
+    async for batch in result.partitions():
+        yield separator + b",".join(orjson.dumps(dict(row)) for row in batch)
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+async def _stream_news(filters: dict) -> AsyncIterator[bytes]:
+    """
+    Stream a news list as a JSON array
+    Uses its own session: the request's session is a yield dependency,
+    and newer FastAPI versions close those before the body is sent
+    """
+    async with AsyncSessionLocal() as session:
+        result = await AsyncNewsRepository(session).stream_as_dicts(STREAM_BATCH_SIZE, **filters)
+        async for chunk in _json_stream(result):
+            yield chunk
+
+
+def _encode_cursor(order_by: OrderBy, value: Any, news_id: int) -> str:
+    """Encode a keyset position (sort field, sort value, id) as an opaque token"""
+    raw = orjson.dumps({"o": order_by.value, "v": value, "i": news_id})
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str, order_by: OrderBy) -> Tuple[Any, int]:
+    """
+    Decode a cursor token back into a keyset position
+    
+    Raises:
+        HTTPException: If the token is malformed, has no sort value or was
+            issued for another sort field
+    """
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(cursor))
+        if data["o"] != order_by.value:
+            raise ValueError("sort field mismatch")
+        if data["v"] is None:
+            raise ValueError("null sort value")
+        value = float(data["v"]) if order_by is OrderBy.score else datetime.fromisoformat(data["v"])
+        return value, int(data["i"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _news_etag(news_id: int, updated_at: datetime) -> str:
+    """ETag of a news version (changes whenever updated_at does)"""
+    return f'"{news_id}-{updated_at.timestamp():.6f}"'
+
+
+def _not_modified(request: Request, etag: str, modified: Optional[datetime] = None) -> bool:
+    """
+    Check the client's conditional headers against the current version
+    If-None-Match wins over If-Modified-Since, as in RFC 9110
+    
+    Args:
+        request: FastAPI request object
+        etag: Current ETag
+        modified: Last modification time (naive UTC), if known
+        
+    Returns:
+        True if a 304 can be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return if_none_match.strip() == "*" or etag in if_none_match
+    
+    since = request.headers.get("if-modified-since")
+    if since and modified is not None:
+        try:
+            return modified.replace(microsecond=0) <= parsedate_to_datetime(since).replace(tzinfo=None)
+        except (TypeError, ValueError):
+            return False
+    return False
+
 
 # ============================================
 # Get News Endpoints
@@ -34,12 +136,13 @@ router = APIRouter(tags=["news"])
 @router.get("/news", response_model=List[NewsResponse])
 async def get_news(
     lang: Optional[str] = Query(None, description="Filter by language"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[StatusFilter] = Query(None, description="Filter by status"),
     date: Optional[str] = Query(None, description="Filter by date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=500, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
-    order_by: str = Query("published", regex="^(published|score|created_at)$"),
-    db: Session = Depends(get_db),
+    order_by: OrderBy = Query(OrderBy.published, description="Sort field"),
+    cursor: Optional[str] = Query(None, description="Continue after a previous page (X-Next-Cursor)"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: str = Depends(get_current_user)
 ):
     """
@@ -51,9 +154,12 @@ async def get_news(
     - **limit**: Maximum number of results (1-500)
     - **offset**: Offset for pagination
     - **order_by**: Sort by field (published, score, created_at)
+    - **cursor**: Keyset pagination token; full pages return the token
+      for the next one in the X-Next-Cursor header
     """
     try:
-        repo = NewsRepository(db)
+        repo = AsyncNewsRepository(db)
+        after = _decode_cursor(cursor, order_by) if cursor else None
         
         # Parse date if provided
         date_filter = None
@@ -66,39 +172,39 @@ async def get_news(
                     detail="Invalid date format. Use YYYY-MM-DD"
                 )
         
-        # Get news
-        news_list = repo.get_all(
+        filters = dict(
             language=lang,
             status=status,
             date_filter=date_filter,
             limit=limit,
             offset=offset,
-            order_by=order_by
+            order_by=order_by,
+            after=after
         )
         
-        logger.info(f"📰 Fetched {len(news_list)} news articles")
-        
-        # Convert to response model
-        return [
-            NewsResponse(
-                id=n.id,
-                title=n.title,
-                language=n.language,
-                published=n.published.isoformat(),
-                highlight_text=n.highlight_text,
-                status=n.status,
-                translated_summary=n.translated_summary,
-                edited_text=n.edited_text,
-                score=n.score,
-                url=n.url,
-                domain_rank=n.domain_rank,
-                categories=n.categories,
-                sentiment=n.sentiment,
-                created_at=n.created_at.isoformat() if n.created_at else None,
-                updated_at=n.updated_at.isoformat() if n.updated_at else None
+        if limit > STREAM_MIN_LIMIT:
+            # The body is not buffered, so look up the page end separately
+            # (headers go out before the body, so this runs here)
+            page_end = await repo.list_page_end(**filters)
+            headers = {"X-Next-Cursor": _encode_cursor(order_by, *page_end)} if page_end else None
+            
+            logger.info(f"📰 Streaming up to {limit} news articles")
+            return StreamingResponse(
+                _stream_news(filters), media_type="application/json", headers=headers
             )
-            for n in news_list
-        ]
+        
+        # Get news as plain rows (no ORM hydration)
+        rows = await repo.list_as_dicts(**filters)
+        
+        logger.info(f"📰 Fetched {len(rows)} news articles")
+        
+        headers = None
+        if len(rows) == limit:
+            last = rows[-1]
+            headers = {"X-Next-Cursor": _encode_cursor(order_by, last[order_by.value], last["id"])}
+        
+        # Rows already match NewsResponse; orjson serializes datetimes natively
+        return ORJSONResponse(content=rows, headers=headers)
         
     except HTTPException:
         raise
@@ -113,17 +219,27 @@ async def get_news(
 @router.get("/news/{news_id}", response_model=NewsResponse)
 async def get_news_by_id(
     news_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     current_user: str = Depends(get_current_user)
 ):
     """
     Get specific news article by ID
+    Answers 304 when the client's copy (ETag / Last-Modified) is current
     
     - **news_id**: News article ID
     """
     try:
-        repo = NewsRepository(db)
-        news = repo.get_by_id(news_id)
+        repo = AsyncNewsRepository(db)
+        
+        # Only updated_at is read when the client already has this version
+        updated_at = await repo.get_updated_at(news_id)
+        news = None
+        if updated_at is not None:
+            etag = _news_etag(news_id, updated_at)
+            if _not_modified(request, etag, updated_at):
+                return Response(status_code=304, headers={"ETag": etag})
+            news = await repo.get_by_id(news_id)
         
         if not news:
             raise HTTPException(
@@ -133,22 +249,16 @@ async def get_news_by_id(
         
         logger.info(f"📰 Fetched news ID {news_id}")
         
-        return NewsResponse(
-            id=news.id,
-            title=news.title,
-            language=news.language,
-            published=news.published.isoformat(),
-            highlight_text=news.highlight_text,
-            status=news.status,
-            translated_summary=news.translated_summary,
-            edited_text=news.edited_text,
-            score=news.score,
-            url=news.url,
-            domain_rank=news.domain_rank,
-            categories=news.categories,
-            sentiment=news.sentiment,
-            created_at=news.created_at.isoformat() if news.created_at else None,
-            updated_at=news.updated_at.isoformat() if news.updated_at else None
+        # Timestamps are stored as naive UTC
+        return ORJSONResponse(
+            content=_to_resp(news),
+            headers={
+                "ETag": _news_etag(news_id, news.updated_at),
+                "Last-Modified": format_datetime(
+                    news.updated_at.replace(tzinfo=timezone.utc), usegmt=True
+                ),
+                "Cache-Control": "no-cache",
+            }
         )
         
     except HTTPException:
@@ -161,12 +271,13 @@ async def get_news_by_id(
         )
 
 
-@router.get("/news/search/{query}")
+@router.get("/news/search/{query}", response_model=List[NewsResponse])
 async def search_news(
     query: str,
     language: Optional[str] = Query(None, description="Filter by language"),
     limit: int = Query(50, ge=1, le=100),
-    db: Session = Depends(get_db),
+    exact: bool = Query(False, description="Substring match instead of full-text search"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: str = Depends(get_current_user)
 ):
     """
@@ -175,28 +286,18 @@ async def search_news(
     - **query**: Search query string
     - **language**: Optional language filter
     - **limit**: Maximum results (1-100)
+    - **exact**: Use substring matching instead of ranked full-text search
     """
     try:
-        repo = NewsRepository(db)
-        news_list = repo.search(query, language, limit)
+        repo = AsyncNewsRepository(db)
+        if exact:
+            news_list = await repo.search(query, language, limit)
+        else:
+            news_list = await repo.search_fts(query, language, limit)
         
         logger.info(f"🔍 Search '{query}': found {len(news_list)} results")
         
-        return [
-            NewsResponse(
-                id=n.id,
-                title=n.title,
-                language=n.language,
-                published=n.published.isoformat(),
-                highlight_text=n.highlight_text,
-                status=n.status,
-                translated_summary=n.translated_summary,
-                edited_text=n.edited_text,
-                score=n.score,
-                url=n.url
-            )
-            for n in news_list
-        ]
+        return ORJSONResponse(content=[_to_resp(news) for news in news_list])
         
     except Exception as e:
         logger.error(f"❌ Search error: {e}")
@@ -212,11 +313,13 @@ async def search_news(
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     current_user: str = Depends(get_current_user)
 ):
     """
     Get news statistics
+    Answers 304 when the client's copy (ETag) is current
     
     Returns comprehensive statistics including:
     - Total news count
@@ -224,16 +327,22 @@ async def get_stats(
     - Count by language
     """
     try:
-        repo = NewsRepository(db)
+        repo = AsyncNewsRepository(db)
         
-        stats = StatsResponse(
-            total=repo.count_total(),
-            by_status=repo.count_by_status(),
-            by_language=repo.count_by_language()
-        )
+        # Total, per-status and per-language counts in one round trip
+        # (cached and dropped on every write, so this is usually no query)
+        stats = await repo.get_all_counts()
+        body = orjson.dumps(StatsResponse(**stats).model_dump(), option=orjson.OPT_SORT_KEYS)
         
-        logger.info(f"📊 Stats fetched: {stats.total} total articles")
-        return stats
+        headers = {
+            "ETag": f'"{hashlib.md5(body).hexdigest()}"',
+            "Cache-Control": "no-cache",
+        }
+        if _not_modified(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        logger.info(f"📊 Stats fetched: {stats['total']} total articles")
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         logger.error(f"❌ Error fetching stats: {e}")
@@ -245,17 +354,17 @@ async def get_stats(
 
 @router.get("/stats/detailed")
 async def get_detailed_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: str = Depends(get_current_user)
 ):
     """
     Get detailed statistics including averages and today's stats
     """
     try:
-        repo = NewsRepository(db)
+        repo = AsyncNewsRepository(db)
         
-        stats = repo.get_statistics()
-        today_stats = repo.get_today_stats()
+        stats = await repo.get_statistics()
+        today_stats = await repo.get_today_stats()
         
         return {
             **stats,
@@ -274,51 +383,76 @@ async def get_detailed_stats(
 # Workflow Management Endpoints
 # ============================================
 
-@router.post("/approve_translate/{news_id}")
+def _translate_news(news_id: int):
+    """
+    Translate one approved news and store the result
+    Runs as a background task, with its own database session
+    The news is claimed first, so the scheduled translator cannot
+    translate it at the same time
+    """
+    db = SessionLocal()
+    repo = NewsRepository(db)
+    claimed = False
+    try:
+        rows = repo.claim_for_translation(limit=1, news_id=news_id)
+        if not rows:
+            logger.info(f"ℹ️ News ID {news_id} already claimed or no longer approved")
+            return
+        claimed = True
+        news = rows[0]
+        
+        # Give the connection back to the pool while the API call runs
+        db.close()
+        translated = translation_service.translate(news.highlight_text or news.title)
+        
+        if translated:
+            # Stores the translation and moves to ready_for_final in one UPDATE
+            if repo.update_translation(news_id, translated, translated):
+                logger.info(f"✅ News ID {news_id} translated successfully")
+            claimed = False
+        else:
+            logger.warning(f"⚠️ Translation failed for news ID {news_id}")
+            
+    except Exception as e:
+        logger.error(f"❌ Background translation error for news ID {news_id}: {e}")
+    finally:
+        if claimed:
+            # Back to approved_for_translate, the scheduled translator retries it
+            repo.release_translation_claims([news_id])
+        db.close()
+
+
+@router.post("/approve_translate/{news_id}", status_code=202)
 async def approve_for_translation(
     news_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: str = Depends(get_current_user)
 ):
     """
-    Approve news for translation and start translation process
+    Approve news for translation and queue the translation
+    Returns right away; the translation runs in the background
     
     - **news_id**: News article ID to approve
     """
     try:
         repo = NewsRepository(db)
-        news = repo.get_by_id(news_id)
         
-        if not news:
+        # Mark approved (a missing news matches nothing)
+        if not repo.update_status(news_id, NewsStatus.APPROVED_FOR_TRANSLATE):
             raise HTTPException(
                 status_code=404, 
                 detail=f"News with ID {news_id} not found"
             )
         
-        # Update status
-        repo.update_status(news_id, NewsStatus.APPROVED_FOR_TRANSLATE)
-        
-        # Start translation
-        text_to_translate = news.highlight_text or news.title
-        translated = translation_service.translate(text_to_translate)
+        background_tasks.add_task(_translate_news, news_id)
+        logger.info(f"📋 News ID {news_id} queued for translation")
         
-        if translated:
-            repo.update_translation(news_id, translated, translated)
-            logger.info(f"✅ News ID {news_id} translated successfully")
-            
-            return SuccessResponse(
-                status="success",
-                message="News translated and ready for review",
-                data={"news_id": news_id, "translated": True}
-            )
-        else:
-            logger.warning(f"⚠️ Translation failed for news ID {news_id}")
-            
-            return SuccessResponse(
-                status="warning",
-                message="News approved but translation failed",
-                data={"news_id": news_id, "translated": False}
-            )
+        return SuccessResponse(
+            status="queued",
+            message="News approved, translation started",
+            data={"news_id": news_id}
+        )
         
     except HTTPException:
         raise
@@ -343,24 +477,20 @@ async def final_approve(
     """
     try:
         repo = NewsRepository(db)
-        news = repo.get_by_id(news_id)
-        
-        if not news:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"News with ID {news_id} not found"
-            )
         
-        # Check if news has translation
-        if not news.translated_summary and not news.edited_text:
+        # Queue for publishing, only if translated (single UPDATE)
+        if not repo.queue_if_translated(news_id):
+            # Nothing updated: tell a missing news from an untranslated one
+            if not repo.exists(news_id):
+                raise HTTPException(
+                    status_code=404, 
+                    detail=f"News with ID {news_id} not found"
+                )
             raise HTTPException(
                 status_code=400,
                 detail="News must be translated before final approval"
             )
         
-        # Update status to publishing queue
-        repo.update_status(news_id, NewsStatus.PUBLISHED_QUEUE)
-        
         logger.info(f"✅ News ID {news_id} queued for publication")
         
         return SuccessResponse(
@@ -392,7 +522,7 @@ async def publish_now(
     """
     try:
         repo = NewsRepository(db)
-        news = repo.get_by_id(news_id)
+        news = repo.get_publish_payload(news_id)
         
         if not news:
             raise HTTPException(
@@ -401,15 +531,16 @@ async def publish_now(
             )
         
         # Check if news has translation
-        if not news.edited_text and not news.translated_summary:
+        if not news["edited_text"] and not news["translated_summary"]:
             raise HTTPException(
                 status_code=400, 
                 detail="News must be translated before publishing"
             )
         
-        # Create and send message
+        # Create and send message, without holding a connection meanwhile
         message = telegram_service.create_news_message(news)
-        success = telegram_service.send_message(message)
+        db.close()
+        success = await telegram_service.async_send_message(message)
         
         if success:
             repo.update_status(news_id, NewsStatus.PUBLISHED)
@@ -436,6 +567,62 @@ async def publish_now(
         )
 
 
+@router.post("/publish_batch")
+async def publish_batch(
+    news_ids: List[int],
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Publish several news to Telegram at once
+    Messages are sent concurrently; statuses are updated in one statement
+    
+    - **news_ids**: List of news IDs to publish
+    """
+    try:
+        repo = NewsRepository(db)
+        
+        # Only translated news can be published
+        news_list = repo.get_publish_payloads(news_ids)
+        if not news_list:
+            raise HTTPException(
+                status_code=400,
+                detail="No translated news found for the given IDs"
+            )
+        
+        messages = [telegram_service.create_news_message(news) for news in news_list]
+        db.close()  # Not needed again until the status update
+        
+        results = await asyncio.gather(
+            *(telegram_service.async_send_message(message) for message in messages),
+            return_exceptions=True
+        )
+        
+        published = [news["id"] for news, ok in zip(news_list, results) if ok is True]
+        published_ids = set(published)
+        failed = [news_id for news_id in news_ids if news_id not in published_ids]
+        
+        if published:
+            repo.bulk_update_status(published, NewsStatus.PUBLISHED)
+        
+        logger.info(f"✅ Batch published {len(published)}/{len(news_ids)} news")
+        
+        return SuccessResponse(
+            status="success" if published else "error",
+            message=f"Published {len(published)} of {len(news_ids)} news",
+            data={"published": published, "failed": failed}
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Batch publishing error: {e}")
+        raise HTTPException(
+            status_code=500, 
+            detail="Batch publishing failed"
+        )
+
+
 # ============================================
 # Delete Endpoints
 # ============================================
@@ -454,28 +641,19 @@ async def delete_news(
     try:
         repo = NewsRepository(db)
         
-        # Check if exists
-        if not repo.exists(news_id):
+        # Delete and learn whether it existed in one statement
+        if not repo.delete_returning(news_id):
             raise HTTPException(
                 status_code=404, 
                 detail=f"News with ID {news_id} not found"
             )
         
-        # Delete
-        success = repo.delete(news_id)
+        logger.warning(f"🗑️ News ID {news_id} deleted by {current_user}")
         
-        if success:
-            logger.warning(f"🗑️ News ID {news_id} deleted by {current_user}")
-            
-            return SuccessResponse(
-                status="success",
-                message=f"News ID {news_id} deleted successfully"
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to delete news"
-            )
+        return SuccessResponse(
+            status="success",
+            message=f"News ID {news_id} deleted successfully"
+        )
         
     except HTTPException:
         raise
@@ -506,10 +684,10 @@ async def bulk_update_status(
     """
     try:
         # Validate status
-        if new_status not in NewsStatus.all_statuses():
+        if new_status not in NewsStatus.ALL:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid status. Must be one of: {NewsStatus.all_statuses()}"
+                detail=f"Invalid status. Must be one of: {sorted(NewsStatus.ALL)}"
             )
         
         repo = NewsRepository(db)
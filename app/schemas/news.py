@@ -101,7 +101,7 @@ class NewsCreate(NewsBase):
     highlight_text: Optional[str] = None
     published: datetime
     domain_rank: Optional[int] = None
-    categories: Optional[str] = None
+    categories: List[str] = []
     sentiment: Optional[str] = None
     score: float = 0.0
     status: str = "collected"
@@ -121,7 +121,7 @@ class NewsResponse(BaseModel):
     id: int
     title: str
     language: str
-    published: str
+    published: datetime
     highlight_text: Optional[str] = None
     status: str
     translated_summary: Optional[str] = None
@@ -129,10 +129,10 @@ class NewsResponse(BaseModel):
     score: float
     url: str
     domain_rank: Optional[int] = None
-    categories: Optional[str] = None
+    categories: Optional[List[str]] = None
     sentiment: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True  # Allows creation from ORM models
@@ -149,7 +149,7 @@ class NewsResponse(BaseModel):
                 "score": 0.85,
                 "url": "https://example.com/news/123",
                 "domain_rank": 1000,
-                "categories": "Politics,International",
+                "categories": ["Politics", "International"],
                 "sentiment": "neutral"
             }
         }
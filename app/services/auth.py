@@ -2,11 +2,14 @@
 Authentication service with session management
 Handles user authentication, session creation, and session validation
 """
+import asyncio
+import hmac
 import secrets
 import logging
+import time
 import bcrypt
-from datetime import datetime, timedelta
-from typing import Optional, Dict
+from collections import OrderedDict
+from typing import Optional
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,11 +25,41 @@ class AuthService:
         """Initialize authentication service"""
         self.admin_username = settings.ADMIN_USERNAME
         self.admin_password_hash = settings.ADMIN_PASSWORD_HASH
-        self.active_sessions: Dict[str, dict] = {}
+        # ترتیب درج = ترتیب انقضا (همه session ها TTL یکسان دارند)
+        self.active_sessions: "OrderedDict[str, dict]" = OrderedDict()
         self.session_expire_hours = settings.SESSION_EXPIRE_HOURS
+        self._session_ttl = self.session_expire_hours * 3600.0  # ثانیه
+        
+        # بایت‌ها یک بار ساخته می‌شوند؛ مقادیر تنظیمات در اجرا تغییر نمی‌کنند
+        self._admin_username_bytes = self.admin_username.encode('utf-8')
+        self._admin_password_hash_bytes = self.admin_password_hash.encode('utf-8')
+        
+        # hash ساختگی با همان cost، تا نام کاربری اشتباه هم یک bcrypt کامل
+        # اجرا کند و زمان پاسخ نشان ندهد کدام فیلد غلط بوده
+        self._dummy_hash = bcrypt.hashpw(
+            secrets.token_bytes(16),
+            bcrypt.gensalt(rounds=self._hash_rounds(self.admin_password_hash))
+        )
         
         logger.info("🔐 AuthService initialized")
     
+    @staticmethod
+    def _hash_rounds(password_hash: str, default: int = settings.BCRYPT_ROUNDS) -> int:
+        """
+        Read the cost factor out of a bcrypt hash ($2b$<rounds>$...)
+        
+        Args:
+            password_hash: bcrypt hash
+            default: Cost used when the hash cannot be parsed
+            
+        Returns:
+            Cost factor (log2 rounds)
+        """
+        try:
+            return int(password_hash.split('$')[2])
+        except (IndexError, ValueError):
+            return default
+    
     def authenticate(self, username: str, password: str) -> bool:
         """
         بررسی username و password
@@ -39,20 +72,21 @@ class AuthService:
             True اگر اعتبارسنجی موفق باشد، False در غیر این صورت
         """
         try:
-            # بررسی username
-            if username != self.admin_username:
-                logger.warning(f"❌ Invalid username attempt: {username}")
-                return False
+            # بررسی username در زمان ثابت (بدون توقف روی اولین بایت متفاوت)
+            user_ok = hmac.compare_digest(username.encode('utf-8'), self._admin_username_bytes)
             
-            # کار با bcrypt - بررسی password با hash ذخیره شده
+            # کار با bcrypt - همیشه اجرا می‌شود؛ برای username اشتباه با hash ساختگی
             password_bytes = password.encode('utf-8')
-            hash_bytes = self.admin_password_hash.encode('utf-8')
+            hash_bytes = self._admin_password_hash_bytes if user_ok else self._dummy_hash
             
             # برگرداندن True/False
-            is_valid = bcrypt.checkpw(password_bytes, hash_bytes)
+            is_valid = bcrypt.checkpw(password_bytes, hash_bytes) and user_ok
             
+            # لاگ بعد از bcrypt، تا روی زمان پاسخ اثر نگذارد
             if is_valid:
                 logger.info(f"✅ Successful authentication for user: {username}")
+            elif not user_ok:
+                logger.warning(f"❌ Invalid username attempt: {username}")
             else:
                 logger.warning(f"❌ Invalid password for user: {username}")
             
@@ -62,6 +96,21 @@ class AuthService:
             logger.error(f"❌ Authentication error: {e}")
             return False
     
+    async def authenticate_async(self, username: str, password: str) -> bool:
+        """
+        authenticate() در یک thread جداگانه
+        bcrypt حلقه رویداد را مسدود نمی‌کند و چند ورود همزمان روی چند هسته اجرا می‌شوند
+        (bcrypt هنگام hash کردن GIL را آزاد می‌کند)
+        
+        Args:
+            username: نام کاربری
+            password: رمز عبور (plain text)
+            
+        Returns:
+            True اگر اعتبارسنجی موفق باشد، False در غیر این صورت
+        """
+        return await asyncio.to_thread(self.authenticate, username, password)
+    
     def create_session(self, username: str) -> str:
         """
         ساخت token امن و ذخیره session در حافظه
@@ -75,11 +124,13 @@ class AuthService:
         # ساخت token امن
         session_token = secrets.token_urlsafe(32)
         
-        # ذخیره session در حافظه
+        # ذخیره session در حافظه (به انتهای صف اضافه می‌شود)
+        # زمان‌ها به صورت float (ثانیه از epoch)؛ بررسی انقضا یک مقایسه ساده است
+        now = time.time()
         self.active_sessions[session_token] = {
             "username": username,
-            "created_at": datetime.now(),
-            "last_activity": datetime.now()
+            "expires_at": now + self._session_ttl,
+            "last_activity": now
         }
         
         logger.info(f"✅ Session created for user: {username} (token: {session_token[:10]}...)")
@@ -87,38 +138,45 @@ class AuthService:
         # برگرداندن token
         return session_token
     
-    def verify_session(self, token: str) -> bool:
+    def resolve_session(self, token: str) -> Optional[str]:
         """
-        بررسی معتبر بودن token و چک کردن انقضا
+        بررسی معتبر بودن token و برگرداندن نام کاربری در یک مرحله
         
         Args:
             token: Session token برای بررسی
             
         Returns:
-            True اگر session معتبر باشد، False در غیر این صورت
+            نام کاربری اگر session معتبر باشد، None در غیر این صورت
         """
         # بررسی معتبر بودن token
-        if not token or token not in self.active_sessions:
-            return False
-        
-        session_data = self.active_sessions[token]
+        session_data = self.active_sessions.get(token) if token else None
+        if session_data is None:
+            return None
         
         # چک کردن انقضا
-        created_at = session_data["created_at"]
-        age = datetime.now() - created_at
-        
-        if age.total_seconds() > self.session_expire_hours * 3600:
+        now = time.time()
+        if now > session_data["expires_at"]:
             # Session منقضی شده
             logger.info(f"⏰ Session expired: {token[:10]}...")
             self.delete_session(token)
-            # برگرداندن False
-            return False
+            return None
         
         # بروزرسانی آخرین فعالیت
-        session_data["last_activity"] = datetime.now()
+        session_data["last_activity"] = now
         
-        # برگرداندن True
-        return True
+        return session_data["username"]
+    
+    def verify_session(self, token: str) -> bool:
+        """
+        بررسی معتبر بودن token و چک کردن انقضا
+        
+        Args:
+            token: Session token برای بررسی
+            
+        Returns:
+            True اگر session معتبر باشد، False در غیر این صورت
+        """
+        return self.resolve_session(token) is not None
     
     def delete_session(self, session_token: str) -> bool:
         """
@@ -141,20 +199,21 @@ class AuthService:
         """
         پاکسازی تمام session های منقضی شده
         این تابع باید به صورت دوره‌ای اجرا شود
+        قدیمی‌ترین session ها اول صف هستند، پس با اولین session معتبر
+        پیمایش متوقف می‌شود: هزینه به تعداد session های منقضی بستگی دارد
         """
-        now = datetime.now()
-        expired = []
-        
-        for session_token, data in self.active_sessions.items():
-            age = now - data["created_at"]
-            if age.total_seconds() > self.session_expire_hours * 3600:
-                expired.append(session_token)
+        now = time.time()
+        expired = 0
         
-        for session_token in expired:
-            self.delete_session(session_token)
+        while self.active_sessions:
+            data = next(iter(self.active_sessions.values()))
+            if data["expires_at"] >= now:
+                break
+            self.active_sessions.popitem(last=False)
+            expired += 1
         
         if expired:
-            logger.info(f"🧹 Cleaned up {len(expired)} expired sessions")
+            logger.info(f"🧹 Cleaned up {expired} expired sessions")
     
     def get_active_sessions_count(self) -> int:
         """
@@ -175,10 +234,7 @@ class AuthService:
         Returns:
             نام کاربری اگر session معتبر باشد، None در غیر این صورت
         """
-        if not self.verify_session(session_token):
-            return None
-        
-        return self.active_sessions[session_token]["username"]
+        return self.resolve_session(session_token)
     
     def hash_password(self, password: str) -> str:
         """
@@ -192,7 +248,7 @@ class AuthService:
             رمز عبور hash شده با bcrypt
         """
         password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
 
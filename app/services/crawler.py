@@ -2,12 +2,14 @@
 Async News crawler service using Webz.io API
 Handles news collection, deduplication, and scoring with async/await
 """
+import html
 import logging
 import asyncio
+import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
-from bs4 import BeautifulSoup
-from fuzzywuzzy import fuzz
+from typing import List, Optional, Tuple
+from rapidfuzz import fuzz, process
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -18,6 +20,14 @@ from app.utils.scoring import news_scorer
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity (0-100) for a post to count as a duplicate; the .5
+# keeps the old "> 85" / "> 80" on fuzzywuzzy's rounded integer scores
+TITLE_SIMILARITY = 85.5
+HIGHLIGHT_SIMILARITY = 80.5
+
+# Highlights are text with a few inline tags (<em>, <b>), no real markup
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class AsyncCrawlerService:
     """
@@ -195,59 +205,117 @@ class AsyncCrawlerService:
         limit: int,
         session
     ) -> List[News]:
-        """Process API response asynchronously"""
+        """
+        Process API response asynchronously
+        Each page link only arrives with the previous page, so pages cannot
+        be requested all at once; instead the next page downloads while the
+        current one is parsed, scored and stored
+        """
         news_list = []
-        next_url = response_data.get('next')
         page_count = 0
         
         # Get recent news for duplicate checking
         recent_news = repo.get_recent_for_duplicate_check(days=7)
+        recent_urls = {news.url for news in recent_news}
+        
+        # Lowercased once here instead of once per post in _is_duplicate
+        recent_texts = (
+            [news.title.lower() for news in recent_news],
+            [news.highlight_text[:200].lower() for news in recent_news if news.highlight_text]
+        )
         
-        while next_url and len(news_list) < limit and page_count < max_pages:
+        while response_data and len(news_list) < limit and page_count < max_pages:
             page_count += 1
             
+            # Prefetch the next page (only one request in flight at a time)
+            next_url = response_data.get('next')
+            next_page = None
+            if next_url and page_count < max_pages:
+                next_page = asyncio.create_task(self._fetch_page(session, next_url))
+            
+            pending = []
             for post in response_data.get('posts', []):
-                if len(news_list) >= limit:
+                if len(news_list) + len(pending) >= limit:
                     break
                 
+                # Exact URL match is an O(1) check, before any parsing
+                if post.get('url') in recent_urls:
+                    logger.debug(f"⏭️ Already stored: {post['url']}")
+                    continue
+                
                 try:
-                    news_article = self._create_news_from_post(post, language, recent_news)
+                    news_article = self._create_news_from_post(post, language, recent_texts)
                     
                     if news_article:
-                        saved = repo.create(news_article)
-                        news_list.append(saved)
+                        pending.append(news_article)
+                        recent_urls.add(news_article.url)
                         
                 except Exception as e:
                     logger.error(f"❌ Error processing post: {e}")
                     continue
             
-            # Fetch next page
-            if next_url and len(news_list) < limit:
-                try:
-                    if not next_url.startswith(('http://', 'https://')):
-                        next_url = f"https://api.webz.io{next_url}"
-                    
-                    async with session.get(next_url) as response:
-                        response_data = await response.json()
-                        next_url = response_data.get('next')
-                    
-                except Exception as e:
-                    logger.error(f"❌ Pagination error: {e}")
-                    break
+            # One INSERT per page, off the event loop
+            if pending:
+                news_list.extend(await asyncio.to_thread(self._save_batch, repo, pending))
+            
+            if next_page is None:
+                break
+            if len(news_list) >= limit:
+                next_page.cancel()
+                break
+            response_data = await next_page
         
         return news_list
     
+    @staticmethod
+    async def _fetch_page(session, next_url: str) -> Optional[dict]:
+        """
+        Fetch one result page from a Webz.io "next" link
+        
+        Returns:
+            Response data, or None on error
+        """
+        try:
+            if not next_url.startswith(('http://', 'https://')):
+                next_url = f"https://api.webz.io{next_url}"
+            
+            async with session.get(next_url) as response:
+                return await response.json()
+            
+        except Exception as e:
+            logger.error(f"❌ Pagination error: {e}")
+            return None
+    
+    @staticmethod
+    def _save_batch(repo: NewsRepository, pending: List[News]) -> List[News]:
+        """
+        Store the new articles of one page
+        Falls back to row-by-row inserts if the batch hits a duplicate URL,
+        so one conflicting article does not drop the whole page
+        """
+        try:
+            return repo.bulk_create(pending)
+        except IntegrityError:
+            logger.warning("⚠️ Duplicate URL in batch, saving articles one by one")
+        
+        saved = []
+        for news in pending:
+            try:
+                saved.append(repo.create(news))
+            except IntegrityError:
+                logger.debug(f"⏭️ Already stored: {news.url}")
+        return saved
+    
     def _create_news_from_post(
         self,
         post: dict,
         language: str,
-        recent_news: List[News]
+        recent_texts: Tuple[List[str], List[str]]
     ) -> Optional[News]:
         """Create News object from API post"""
         try:
             # Parse highlight text
-            soup = BeautifulSoup(post['highlightText'], 'html.parser')
-            clean_highlight = soup.get_text()
+            clean_highlight = html.unescape(_TAG_RE.sub('', post['highlightText']))
             
             # Parse date
             published_str = post['published'].replace('Z', '+00:00')
@@ -270,7 +338,7 @@ class AsyncCrawlerService:
             )
             
             # Check for duplicates
-            if self._is_duplicate(post['title'], clean_highlight, recent_news):
+            if self._is_duplicate(post['title'], clean_highlight, recent_texts):
                 logger.debug(f"⏭️ Duplicate: {post['title'][:50]}")
                 return None
             
@@ -290,13 +358,11 @@ class AsyncCrawlerService:
                 url=post['url'],
                 published=published_date,
                 domain_rank=post['thread'].get('domain_rank'),
-                categories=','.join(categories) if categories else None,
+                categories=categories,
                 sentiment=post.get('sentiment'),
                 language=language,
                 score=score,
-                status=NewsStatus.COLLECTED,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
+                status=NewsStatus.COLLECTED
             )
             
         except Exception as e:
@@ -307,25 +373,33 @@ class AsyncCrawlerService:
         self,
         title: str,
         highlight: str,
-        recent_news: List[News]
+        recent_texts: Tuple[List[str], List[str]]
     ) -> bool:
-        """Check for duplicates using fuzzy matching"""
-        for news in recent_news:
-            # Title similarity
-            title_similarity = fuzz.ratio(title.lower(), news.title.lower())
-            
-            if title_similarity > 85:
-                return True
-            
-            # Highlight similarity
-            if news.highlight_text and highlight:
-                highlight_similarity = fuzz.partial_ratio(
-                    highlight.lower()[:200],
-                    news.highlight_text.lower()[:200]
-                )
-                
-                if highlight_similarity > 80:
-                    return True
+        """
+        Check for duplicates using fuzzy matching
+        Each check is one native rapidfuzz call over all recent news;
+        score_cutoff lets it skip candidates that cannot reach the threshold
+        
+        Args:
+            title: Title of the new post
+            highlight: Clean highlight text of the new post
+            recent_texts: Lowercased recent titles, and the lowercased first
+                200 chars of recent highlights
+        """
+        recent_titles, recent_highlights = recent_texts
+        
+        # Title similarity
+        if process.extractOne(
+            title.lower(), recent_titles, scorer=fuzz.ratio, score_cutoff=TITLE_SIMILARITY
+        ):
+            return True
+        
+        # Highlight similarity
+        if highlight and process.extractOne(
+            highlight.lower()[:200], recent_highlights,
+            scorer=fuzz.partial_ratio, score_cutoff=HIGHLIGHT_SIMILARITY
+        ):
+            return True
         
         return False
     
@@ -355,6 +429,20 @@ class AsyncCrawlerService:
             return
         self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
         logger.info(f"🔄 Rotated to API key index: {self.current_key_index}")
+    
+    def get_api_status(self) -> dict:
+        """
+        Get crawler API status
+        
+        Returns:
+            Dictionary with API key and proxy information
+        """
+        return {
+            "api_keys": len(self.api_keys),
+            "current_key_index": self.current_key_index,
+            "base_url": self.base_url,
+            "proxy": async_proxy_manager.get_status()
+        }
 
 
 # Singleton instance
@@ -3,10 +3,10 @@ Telegram service for publishing news
 """
 import logging
 import random
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional
+import httpx
 from app.config import settings
-from app.utils.proxy import async_proxy_manager as proxy_manager
-from app.models.news import News
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +39,7 @@ class TelegramService:
                 'parse_mode': 'HTML'
             }
             
-            session = proxy_manager.create_session(timeout=30)
-            response = session.post(url, json=payload, timeout=30)
+            response = _get_sync_client().post(url, json=payload)
             
             if response.status_code == 200:
                 logger.info("Message sent to Telegram successfully")
@@ -53,56 +52,60 @@ class TelegramService:
             logger.error(f"Failed to send Telegram message: {e}")
             return False
     
-    def create_news_message(self, news: News) -> str:
+    async def async_send_message(self, message: str, disable_preview: bool = False) -> bool:
+        """
+        Send message to Telegram channel without blocking the event loop
+        Uses a shared client, so concurrent sends reuse its connections
+        
+        Args:
+            message: Message text (HTML formatted)
+            disable_preview: Disable web page preview
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            response = await _get_client().post(
+                f"{self.base_url}/sendMessage",
+                json={
+                    'chat_id': self.channel_id,
+                    'text': message,
+                    'disable_web_page_preview': disable_preview,
+                    'parse_mode': 'HTML'
+                }
+            )
+            
+            if response.status_code == 200:
+                logger.info("Message sent to Telegram successfully")
+                return True
+            else:
+                logger.error(f"Telegram API error: {response.status_code} - {response.text}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Failed to send Telegram message: {e}")
+            return False
+    
+    def create_news_message(self, news: Mapping) -> str:
         """
         Create formatted message for news article
+        Rendered messages are cached per news and update time, so
+        retries and previews reuse the same string
         
         Args:
-            news: News article
+            news: News fields (see PUBLISH_COLUMNS in the news repository)
             
         Returns:
             Formatted HTML message
         """
-        # Title variations
-        title_variants = [
-            news.title,
-            f"📰 {news.title}",
-            f"خبر فوری: {news.title}",
-            f"🔴 {news.title}"
-        ]
-        
-        # Hashtags
-        hashtag_variants = [
-            "#خبر #ایران #سیاسی",
-            "#ایران #سیاسی #بین_المللی",
-            "#خبر_فوری #ایران #سیاسی",
-            "#تحلیل_سیاسی #ایران #خارجی"
-        ]
-        
         # Use edited text if available, otherwise translated summary
-        content = news.edited_text or news.translated_summary
+        content = news["edited_text"] or news["translated_summary"]
+        updated_at = news["updated_at"].timestamp() if news["updated_at"] else 0.0
         
-        if content:
-            # Clean and optimize content
-            content = self._clean_content(content)
-        else:
-            content = "متن ترجمه شده در دسترس نیست."
-        
-        # Build message
-        message = f"""
-{random.choice(title_variants)}
-
-{content}
-
-📖 ادامه مطلب: {news.url}
-
-{random.choice(hashtag_variants)}
-🔹 @IranBureau
-        """
-        
-        return message.strip()
+        return _render_message(news["id"], updated_at, news["title"], content, news["url"])
     
-    def _clean_content(self, content: str) -> str:
+    @staticmethod
+    def _clean_content(content: str) -> str:
         """
         Clean and optimize content for Telegram
         
@@ -148,19 +151,115 @@ class TelegramService:
         """
         try:
             url = f"{self.base_url}/getMe"
-            session = proxy_manager.create_session(timeout=10)
-            response = session.get(url, timeout=10)
+            response = _get_sync_client().get(url, timeout=10)
             
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Telegram connection test failed: {e}")
             return False
     
+    async def async_test_connection(self) -> bool:
+        """
+        Test Telegram connection without blocking the event loop
+        
+        Returns:
+            True if connection successful
+        """
+        try:
+            response = await _get_client().get(f"{self.base_url}/getMe", timeout=10)
+            return response.status_code == 200
+        except Exception as e:
+            logger.error(f"Telegram connection test failed: {e}")
+            return False
+    
+    async def aclose(self):
+        """Close the shared HTTP clients (call on application shutdown)"""
+        if _get_client.cache_info().currsize:
+            await _get_client().aclose()
+            _get_client.cache_clear()
+        if _get_sync_client.cache_info().currsize:
+            _get_sync_client().close()
+            _get_sync_client.cache_clear()
+    
     def send_test_message(self) -> bool:
         """Send a test message to verify configuration"""
         test_message = "🔧 Test connection: If you see this message, Telegram connection is working."
         return self.send_message(test_message)
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> httpx.AsyncClient:
+    """
+    Shared async client for the Bot API
+    HTTP/2 multiplexes concurrent sends over one kept-alive connection;
+    few connections: Telegram rate-limits bursts to one channel anyway
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        proxies=settings.SOCKS5_PROXY or None,
+        limits=httpx.Limits(max_connections=5, max_keepalive_connections=5)
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_sync_client() -> httpx.Client:
+    """Shared blocking client for scheduler jobs (keeps the TLS connection alive)"""
+    return httpx.Client(
+        http2=True,
+        timeout=30,
+        proxies=settings.SOCKS5_PROXY or None
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_message(
+    news_id: int,
+    updated_at: float,
+    title: str,
+    content: Optional[str],
+    url: str
+) -> str:
+    """
+    Render the Telegram message for a news article
+    Keyed on news ID and update time, so edits invalidate the cache
+    """
+    # Title variations
+    title_variants = [
+        title,
+        f"📰 {title}",
+        f"خبر فوری: {title}",
+        f"🔴 {title}"
+    ]
+    
+    # Hashtags
+    hashtag_variants = [
+        "#خبر #ایران #سیاسی",
+        "#ایران #سیاسی #بین_المللی",
+        "#خبر_فوری #ایران #سیاسی",
+        "#تحلیل_سیاسی #ایران #خارجی"
+    ]
+    
+    if content:
+        # Clean and optimize content
+        content = TelegramService._clean_content(content)
+    else:
+        content = "متن ترجمه شده در دسترس نیست."
+    
+    # Build message
+    message = f"""
+{random.choice(title_variants)}
+
+{content}
+
+📖 ادامه مطلب: {url}
+
+{random.choice(hashtag_variants)}
+🔹 @IranBureau
+    """
+    
+    return message.strip()
+
+
 # Singleton instance
 telegram_service = TelegramService()
\ No newline at end of file
@@ -3,7 +3,8 @@ Translation service using Gemini AI and Google Translate
 """
 import logging
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from deep_translator import GoogleTranslator
 from app.config import settings
 from app.utils.proxy import async_proxy_manager as proxy_manager
@@ -15,7 +16,7 @@ class TranslationService:
     """Handles news translation with multiple providers"""
     
     def __init__(self):
-        self.gemini_keys = settings.GEMINI_API_KEYS
+        self.gemini_keys = settings.gemini_api_keys_list
         self.current_gemini_key = 0
         self.max_retries = 3
     
@@ -48,6 +49,32 @@ class TranslationService:
         logger.info("Falling back to Google Translate")
         return self._translate_with_google(text, target_lang)
     
+    def translate_batch(self, texts: List[str], target_lang: str = 'fa') -> List[Optional[str]]:
+        """
+        Translate several texts concurrently
+        Each text is translated in its own worker thread, so the batch
+        takes roughly as long as the slowest translation
+        
+        Args:
+            texts: Texts to translate
+            target_lang: Target language code
+            
+        Returns:
+            Translated texts (None on failure), in the same order as input
+        """
+        if not texts:
+            return []
+        
+        def _translate(text: str) -> Optional[str]:
+            try:
+                return self.translate(text, target_lang)
+            except Exception as e:
+                logger.error(f"Batch translation item failed: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            return list(executor.map(_translate, texts))
+    
     def _translate_with_gemini(self, text: str, target_lang: str) -> Optional[str]:
         """
         Translate using Gemini AI
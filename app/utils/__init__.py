@@ -5,7 +5,7 @@
 Utility functions and helpers
 """
 from .scoring import news_scorer, NewsScorer
-from .logging import setup_logging, get_logger, LogAnalyzer
+from .logging import setup_logging, stop_logging, get_logger, LogAnalyzer
 
 __all__ = [
     "proxy_manager",
@@ -13,6 +13,7 @@ __all__ = [
     "news_scorer",
     "NewsScorer",
     "setup_logging",
+    "stop_logging",
     "get_logger",
     "LogAnalyzer"
 ]
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Cached wall-clock timestamps
+Responses only need second precision, so the ISO string is built once
+per second and shared by every request in that second
+"""
+import time
+from datetime import datetime
+from typing import Tuple
+
+# (unix second, ISO string for that second)
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def now_iso() -> str:
+    """
+    Get current local time in ISO format (second precision)
+
+    Returns:
+        ISO timestamp, e.g. 2024-01-15T10:30:00
+    """
+    global _ts_cache
+
+    second = int(time.time())
+    cached = _ts_cache
+    if cached[0] == second:
+        return cached[1]
+
+    # Single tuple assignment, so readers never see a mixed pair
+    value = datetime.fromtimestamp(second).isoformat()
+    _ts_cache = (second, value)
+    return value
@@ -0,0 +1,175 @@
+"""
+Tail helpers for large log files
+Read from the end of the file in fixed-size blocks, so the cost depends
+on the number of lines requested rather than on the file size
+"""
+import os
+from typing import BinaryIO, Iterator, List
+
+# Bytes read per backward step
+BLOCK_SIZE = 64 * 1024
+
+
+def tail_file(path: str, n: int) -> List[str]:
+    """
+    Get the last lines of a file
+
+    Args:
+        path: File path
+        n: Number of lines
+
+    Returns:
+        Last n lines (with line endings)
+    """
+    if n <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = bytearray()
+
+        # One newline more than needed marks the start of the first line
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            buf[:0] = f.read(step)
+
+    lines = bytes(buf).splitlines(keepends=True)[-n:]
+    return [line.decode("utf-8", "replace") for line in lines]
+
+
+def iter_lines_reversed(path: str) -> Iterator[str]:
+    """
+    Iterate over the lines of a file from last to first
+
+    Args:
+        path: File path
+
+    Yields:
+        Lines (with line endings), newest first
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        remainder = b""
+
+        while pos > 0:
+            step = min(BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + remainder).splitlines(keepends=True)
+
+            # The first line may continue in the previous block
+            remainder = lines.pop(0) if pos > 0 and lines else b""
+            for line in reversed(lines):
+                yield line.decode("utf-8", "replace")
+
+        if remainder:
+            yield remainder.decode("utf-8", "replace")
+
+
+def tail_offset(path: str, n: int) -> int:
+    """
+    Get the byte offset where the last n lines of a file start
+
+    Args:
+        path: File path
+        n: Number of lines
+
+    Returns:
+        Byte offset (0 if the file has n lines or fewer)
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = pos = f.tell()
+        if n <= 0:
+            return size
+
+        # A trailing newline ends the last line, it does not start a new one
+        end = size
+        if size:
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                end = size - 1
+
+        newlines = 0
+        while pos > 0:
+            step = min(BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+
+            index = min(len(block), end - pos)
+            while True:
+                index = block.rfind(b"\n", 0, index)
+                if index < 0:
+                    break
+                newlines += 1
+                if newlines == n:
+                    return pos + index + 1
+
+        return 0
+
+
+def keep_tail(path: str, n: int, chunk_size: int = 1 << 20) -> None:
+    """
+    Shrink a file in place to its last n lines
+    The same inode is kept, so open log handlers keep appending to it
+
+    Args:
+        path: File path
+        n: Number of lines to keep
+        chunk_size: Bytes copied per step
+    """
+    offset = tail_offset(path, n)
+    if offset == 0:
+        return
+
+    with open(path, "r+b") as f:
+        read_pos, write_pos = offset, 0
+        while True:
+            f.seek(read_pos)
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            f.seek(write_pos)
+            f.write(chunk)
+            read_pos += len(chunk)
+            write_pos += len(chunk)
+        f.truncate(write_pos)
+
+
+def iter_tail_chunks(path: str, n: int, chunk_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Iterate over the last lines of a file as raw byte chunks
+    Only one chunk is held in memory at a time, suited for streaming;
+    the file is opened right away, so a missing file raises here and
+    not halfway through a response
+
+    Args:
+        path: File path
+        n: Number of lines
+        chunk_size: Bytes per chunk
+
+    Returns:
+        Iterator over consecutive chunks of the last n lines
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    offset = tail_offset(path, n)
+    f = open(path, "rb")
+    f.seek(offset)
+    return _iter_chunks(f, chunk_size)
+
+
+def _iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Read an open file to the end in chunks, then close it"""
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
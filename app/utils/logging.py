@@ -2,10 +2,19 @@
 Advanced logging utilities
 Provides structured logging, log analysis, and monitoring
 """
+import atexit
 import logging
+import mmap
 import os
+import queue
+import re
 import sys
-from typing import List, Dict, Optional
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
 from pathlib import Path
 from app.config import settings
@@ -15,30 +24,118 @@ from app.config import settings
 # Logging Setup
 # ============================================
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+# File writes are batched: flushed at this many bytes or after this many seconds
+LOG_FLUSH_BYTES = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.1
+
+
+class BatchingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that buffers formatted records in memory
+    One write per batch instead of one per record
+    """
+    
+    def __init__(self, *args, flush_bytes: int = LOG_FLUSH_BYTES,
+                 flush_interval: float = LOG_FLUSH_INTERVAL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+            
+            # Rotation has to account for records still in the buffer
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.stream.tell() + self._buffered + len(msg) >= self.maxBytes:
+                self.flush()
+                self.doRollover()
+            
+            self._buffer.append(msg)
+            self._buffered += len(msg)
+            
+            if (self._buffered >= self.flush_bytes
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write buffered records to disk"""
+        self.acquire()
+        try:
+            if self._buffer and self.stream is not None:
+                self.stream.write("".join(self._buffer))
+                self._buffer.clear()
+                self._buffered = 0
+            self._last_flush = time.monotonic()
+            super().flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.flush()
+        super().close()
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener that flushes its handlers whenever the queue goes idle
+    Buffered records never wait longer than the flush interval
+    """
+    
+    def __init__(self, log_queue, *handlers, flush_interval: float = LOG_FLUSH_INTERVAL, **kwargs):
+        super().__init__(log_queue, *handlers, **kwargs)
+        self.flush_interval = flush_interval
+    
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
 def setup_logging():
     """
     Setup application logging with proper formatting
     Configures both file and console handlers
+    
+    Handlers run on a background QueueListener thread; loggers only
+    enqueue records, so callers never block on disk I/O
     """
+    global _queue_listener
+    
     # Create logs directory if it doesn't exist
     log_dir = Path(settings.LOG_FILE).parent
     if log_dir != Path('.'):
         log_dir.mkdir(parents=True, exist_ok=True)
     
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.LOG_LEVEL))
+    # Stop a previous listener (re-initialization)
+    stop_logging()
     
-    # Remove existing handlers
-    root_logger.handlers.clear()
+    level = getattr(logging, settings.LOG_LEVEL)
+    handlers = []
     
-    # File handler
-    file_handler = logging.FileHandler(
+    # File handler (batched writes)
+    file_handler = BatchingFileHandler(
         settings.LOG_FILE,
+        maxBytes=10_000_000,
+        backupCount=3,
         encoding='utf-8',
         mode='a'
     )
-    file_handler.setLevel(getattr(logging, settings.LOG_LEVEL))
+    file_handler.setLevel(level)
     
     # File formatter (detailed)
     file_formatter = logging.Formatter(
@@ -46,7 +143,7 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
     # Console handler (only in debug mode)
     if settings.DEBUG:
@@ -58,7 +155,17 @@ def setup_logging():
             '%(levelname)s: %(message)s'
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Configure root logger to enqueue records only
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.handlers.clear()
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    _queue_listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Log startup message
     root_logger.info("=" * 50)
@@ -68,6 +175,20 @@ def setup_logging():
     root_logger.info("=" * 50)
 
 
+def stop_logging():
+    """
+    Stop the background log listener
+    Flushes all queued records to disk; call on application shutdown
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module
@@ -81,10 +202,53 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Drain buffered records on interpreter exit as well
+atexit.register(stop_logging)
+
+
 # ============================================
 # Log Analysis
 # ============================================
 
+@contextmanager
+def _map_log_file() -> Iterator[Optional[mmap.mmap]]:
+    """
+    Memory-map the log file read-only
+    Scans run over the page cache directly instead of copying the file
+    into Python lists; yields None for an empty file (cannot be mapped)
+    """
+    fd = os.open(settings.LOG_FILE, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            yield None
+            return
+        
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mm, "madvise"):  # Unix only
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+def _iter_log_lines() -> Iterator[str]:
+    """Iterate over log lines one at a time"""
+    with _map_log_file() as mm:
+        if mm is None:
+            return
+        for line in iter(mm.readline, b""):
+            yield line.decode("utf-8", "replace")
+
+
+@lru_cache(maxsize=1024)
+def _compile_search(search_term: str) -> "re.Pattern[bytes]":
+    """Compile a literal, case-insensitive search over log bytes (cached)"""
+    return re.compile(re.escape(search_term.encode("utf-8")), re.IGNORECASE)
+
+
 class LogAnalyzer:
     """
     Analyze and parse log files
@@ -121,9 +285,6 @@ class LogAnalyzer:
             }
         
         try:
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
-            
             # Initialize statistics
             stats = {
                 "info_count": 0,
@@ -131,10 +292,13 @@ class LogAnalyzer:
                 "error_count": 0
             }
             
-            # Filter logs
-            filtered_logs = []
+            # Filter logs, keeping only the last N matches in memory
+            filtered_logs = deque(maxlen=lines) if lines > 0 else []
+            total_lines = 0
             
-            for log_line in all_logs:
+            for log_line in _iter_log_lines():
+                total_lines += 1
+                
                 # Count by level (before filtering)
                 if "INFO" in log_line:
                     stats["info_count"] += 1
@@ -153,13 +317,12 @@ class LogAnalyzer:
                 
                 filtered_logs.append(log_line)
             
-            # Limit results (get last N lines)
-            displayed_logs = filtered_logs[-lines:] if lines > 0 else filtered_logs
+            displayed_logs = list(filtered_logs)
             
             return {
                 "logs": "".join(displayed_logs),
                 "stats": {
-                    "total_lines": len(all_logs),
+                    "total_lines": total_lines,
                     "displayed_lines": len(displayed_logs),
                     **stats
                 }
@@ -193,14 +356,12 @@ class LogAnalyzer:
             return []
         
         try:
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
-            
-            # Filter for errors
-            errors = [line for line in all_logs if "ERROR" in line]
-            
-            # Return last N errors
-            return errors[-limit:] if errors else []
+            # Keep only the last N errors while scanning
+            errors = deque(
+                (line for line in _iter_log_lines() if "ERROR" in line),
+                maxlen=limit
+            )
+            return list(errors)
             
         except Exception as e:
             logging.error(f"Error reading errors from log: {e}")
@@ -221,14 +382,12 @@ class LogAnalyzer:
             return []
         
         try:
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
-            
-            # Filter for warnings
-            warnings = [line for line in all_logs if "WARNING" in line]
-            
-            # Return last N warnings
-            return warnings[-limit:] if warnings else []
+            # Keep only the last N warnings while scanning
+            warnings = deque(
+                (line for line in _iter_log_lines() if "WARNING" in line),
+                maxlen=limit
+            )
+            return list(warnings)
             
         except Exception as e:
             logging.error(f"Error reading warnings from log: {e}")
@@ -275,25 +434,31 @@ class LogAnalyzer:
             # Get file size
             file_size = os.path.getsize(settings.LOG_FILE)
             
-            # Read all logs
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
+            # Count by level in a single pass
+            info_count = warning_count = error_count = debug_count = 0
+            total_lines = 0
+            first_log = last_log = None
             
-            # Count by level
-            info_count = sum(1 for line in all_logs if "INFO" in line)
-            warning_count = sum(1 for line in all_logs if "WARNING" in line)
-            error_count = sum(1 for line in all_logs if "ERROR" in line)
-            debug_count = sum(1 for line in all_logs if "DEBUG" in line)
-            
-            # Get first and last log timestamps
-            first_log = all_logs[0] if all_logs else None
-            last_log = all_logs[-1] if all_logs else None
+            for line in _iter_log_lines():
+                total_lines += 1
+                if first_log is None:
+                    first_log = line
+                last_log = line
+                
+                if "INFO" in line:
+                    info_count += 1
+                if "WARNING" in line:
+                    warning_count += 1
+                if "ERROR" in line:
+                    error_count += 1
+                if "DEBUG" in line:
+                    debug_count += 1
             
             return {
                 "exists": True,
                 "size_bytes": file_size,
                 "size_mb": round(file_size / (1024 * 1024), 2),
-                "total_lines": len(all_logs),
+                "total_lines": total_lines,
                 "by_level": {
                     "INFO": info_count,
                     "WARNING": warning_count,
@@ -332,25 +497,37 @@ class LogAnalyzer:
             return []
         
         try:
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
-            
+            pattern = _compile_search(search_term)
             matches = []
-            search_lower = search_term.lower()
             
-            for i, line in enumerate(all_logs):
-                if search_lower in line.lower():
-                    if context_lines > 0:
-                        # Add context lines
-                        start = max(0, i - context_lines)
-                        end = min(len(all_logs), i + context_lines + 1)
-                        context = all_logs[start:end]
-                        matches.extend(context)
-                    else:
-                        matches.append(line)
-                    
-                    if len(matches) >= limit:
+            with _map_log_file() as mm:
+                if mm is None:
+                    return []
+                
+                # Regex runs directly over the mapped bytes
+                pos = 0
+                while len(matches) < limit:
+                    match = pattern.search(mm, pos)
+                    if match is None:
                         break
+                    
+                    start = mm.rfind(b"\n", 0, match.start()) + 1
+                    end = mm.find(b"\n", match.end())
+                    end = len(mm) if end < 0 else end + 1
+                    pos = end
+                    
+                    # Widen to context lines before/after the match
+                    for _ in range(context_lines):
+                        if start > 0:
+                            start = mm.rfind(b"\n", 0, start - 1) + 1
+                        if end < len(mm):
+                            next_end = mm.find(b"\n", end)
+                            end = len(mm) if next_end < 0 else next_end + 1
+                    
+                    matches.extend(
+                        line.decode("utf-8", "replace")
+                        for line in mm[start:end].splitlines(keepends=True)
+                    )
             
             return matches[:limit]
             
@@ -373,12 +550,9 @@ class LogAnalyzer:
             return []
         
         try:
-            with open(settings.LOG_FILE, "r", encoding="utf-8") as f:
-                all_logs = f.readlines()
-            
             # Filter by date
             date_logs = [
-                line for line in all_logs 
+                line for line in _iter_log_lines()
                 if target_date in line
             ]
             
@@ -0,0 +1,108 @@
+"""
+In-memory HTML pages
+Pages are read (and gzip-compressed) once at startup instead of on
+every request; an ETag lets browsers revalidate without re-downloading
+"""
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = "static"
+
+# Page name -> file name inside the static directory
+PAGES = {
+    "index": "index.html",
+    "dashboard": "dashboard.html",
+    "advanced_crawl": "advanced_crawl.html",
+    "logs": "logs.html",
+}
+
+
+class StaticPage(NamedTuple):
+    """Raw and gzip-compressed page content"""
+    raw: bytes
+    gzipped: bytes
+    mtime: float
+    etag: str
+
+
+def _read_page(path: Path) -> StaticPage:
+    """Read and compress one page"""
+    raw = path.read_bytes()
+    return StaticPage(
+        raw=raw,
+        gzipped=gzip.compress(raw, 9),
+        mtime=path.stat().st_mtime,
+        etag=f'W/"{hashlib.md5(raw).hexdigest()}"'  # Weak: same for raw and gzip
+    )
+
+
+def load_static_pages(directory: str = STATIC_DIR) -> Dict[str, StaticPage]:
+    """
+    Read all HTML pages into memory
+
+    Args:
+        directory: Static files directory
+
+    Returns:
+        Dictionary of page name to StaticPage
+    """
+    pages = {}
+    for name, filename in PAGES.items():
+        try:
+            pages[name] = _read_page(Path(directory) / filename)
+        except FileNotFoundError:
+            logger.error(f"❌ Static page not found: {filename}")
+
+    logger.info(f"📄 Loaded {len(pages)} static pages")
+    return pages
+
+
+def page_response(request: Request, name: str) -> Response:
+    """
+    Build response for a preloaded page
+    Serves the gzip variant when the client accepts it, and an empty 304
+    when the client already has the current version
+
+    Args:
+        request: FastAPI request object
+        name: Page name (key of PAGES)
+
+    Returns:
+        HTML response
+    """
+    pages = request.app.state.static_html
+    page = pages.get(name)
+
+    # Development: pick up edited pages without a restart
+    if settings.DEBUG and page is not None:
+        path = Path(STATIC_DIR) / PAGES[name]
+        if path.stat().st_mtime != page.mtime:
+            page = pages[name] = _read_page(path)
+
+    if page is None:
+        title = name.replace("_", " ").capitalize()
+        raise HTTPException(status_code=500, detail=f"{title} page not found")
+
+    headers = {
+        "Vary": "Accept-Encoding",
+        "ETag": page.etag,
+        "Cache-Control": "no-cache",  # Always revalidate, the 304 is cheap
+    }
+    if page.etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=page.gzipped, media_type="text/html", headers=headers)
+
+    return Response(content=page.raw, media_type="text/html", headers=headers)
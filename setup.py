@@ -25,7 +25,7 @@ def generate_password_hash():
     
     # استفاده مستقیم از bcrypt
     password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=int(os.getenv("BCRYPT_ROUNDS", "10")))
     hashed = bcrypt.hashpw(password_bytes, salt)
     
     print("\n✅ Password hashed successfully!")
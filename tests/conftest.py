@@ -0,0 +1,57 @@
+"""
+Shared test setup
+Settings are read when app modules are imported, so the environment
+(a throwaway SQLite database and dummy credentials) is prepared here first
+"""
+import os
+import tempfile
+
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix="news-tests-")
+
+TEST_ENV = {
+    "DATABASE_URL": f"sqlite:///{_DB_DIR}/news.db",
+    "SECRET_KEY": "x" * 32,
+    "ADMIN_USERNAME": "admin",
+    "ADMIN_PASSWORD_HASH": "$2b$10$" + "x" * 53,
+    "WEBZ_API_KEYS": "test",
+    "TELEGRAM_BOT_TOKEN": "test",
+    "TELEGRAM_CHANNEL": "test",
+    "SECRET_PATH": "test",
+    "LOG_FILE": os.path.join(_DB_DIR, "test.log"),
+}
+os.environ.update(TEST_ENV)
+
+
+@pytest.fixture
+def db():
+    """Session on the test database; the news table is emptied afterwards"""
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import delete
+    from app.database import SessionLocal
+    from app.models.news import News
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.execute(delete(News))
+        session.commit()
+        session.close()
+
+
+@pytest.fixture
+def client():
+    """API client with authentication bypassed"""
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    from app.dependencies import get_current_user
+    from app.main import app
+
+    app.dependency_overrides[get_current_user] = lambda: "admin"
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,83 @@
+"""
+Database initialization tests
+"""
+import os
+import sqlite3
+import subprocess
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _init_database(db_path: Path) -> subprocess.CompletedProcess:
+    """Import app.database (which runs init_database) in a fresh interpreter"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "SECRET_KEY": "x" * 32,
+        "ADMIN_USERNAME": "admin",
+        "ADMIN_PASSWORD_HASH": "$2b$10$" + "x" * 53,
+        "WEBZ_API_KEYS": "test",
+        "TELEGRAM_BOT_TOKEN": "test",
+        "TELEGRAM_CHANNEL": "test",
+        "SECRET_PATH": "test",
+    }
+    return subprocess.run(
+        [sys.executable, "-c", "import app.database"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+
+
+def test_init_database_twice_on_same_file(tmp_path):
+    """A restart against an existing SQLite database must not fail"""
+    db_path = tmp_path / "news.db"
+    
+    first = _init_database(db_path)
+    assert first.returncode == 0, first.stderr
+    
+    second = _init_database(db_path)
+    assert second.returncode == 0, second.stderr
+    assert "SAWarning" not in second.stderr
+
+
+def test_init_database_migrates_legacy_rows(tmp_path):
+    """NULL scores and second-precision timestamps are rewritten on startup"""
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateTable
+    from app.models.news import News
+    
+    # The news table as created before score was NOT NULL and before the
+    # timestamp defaults kept fractional seconds
+    ddl = str(CreateTable(News.__table__).compile(dialect=sqlite.dialect()))
+    legacy_ddl = ddl.replace("score FLOAT DEFAULT 0 NOT NULL", "score FLOAT").replace(
+        "((STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')))", "CURRENT_TIMESTAMP"
+    )
+    assert legacy_ddl.count("CURRENT_TIMESTAMP") == 2 and "score FLOAT," in legacy_ddl
+    
+    db_path = tmp_path / "news.db"
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute(legacy_ddl)
+        conn.execute(
+            "INSERT INTO news (title, url, published, language, score) "
+            "VALUES ('t', 'https://example.com', '2024-01-01 00:00:00.000000', 'english', NULL)"
+        )
+        conn.commit()
+    
+    result = _init_database(db_path)
+    assert result.returncode == 0, result.stderr
+    
+    with closing(sqlite3.connect(db_path)) as conn:
+        score, created_at, updated_at = conn.execute(
+            "SELECT score, created_at, updated_at FROM news"
+        ).fetchone()
+    assert score == 0
+    assert len(created_at) == len(updated_at) == len("2024-01-01 00:00:00.000000")
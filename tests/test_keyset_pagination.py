@@ -0,0 +1,97 @@
+"""
+Keyset pagination tests for GET /news (X-Next-Cursor)
+"""
+import base64
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+
+from sqlalchemy import text
+
+from app.database import migrate_sqlite_timestamps
+from app.models.news import News
+from app.repositories.news_repository import NewsRepository
+
+
+def _create_news(db, count: int, **fields) -> list:
+    """Insert `count` news in one statement (they share created_at) and return their ids"""
+    published = datetime(2024, 1, 1)
+    news_list = [
+        News(
+            title=f"News {i}",
+            url=f"https://example.com/{i}",
+            published=published + timedelta(minutes=i % 3),
+            language="english",
+            **fields
+        )
+        for i in range(count)
+    ]
+    return [news.id for news in NewsRepository(db).bulk_create(news_list)]
+
+
+def _walk(client, limit: int, order_by: str, max_pages: int = 50) -> list:
+    """Follow X-Next-Cursor from the first page and collect the ids of every page"""
+    params = {"limit": limit, "order_by": order_by}
+    ids = []
+    for _ in range(max_pages):
+        response = client.get("/news", params=params)
+        assert response.status_code == 200, response.text
+        ids.extend(row["id"] for row in response.json())
+
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return ids
+        params["cursor"] = cursor
+    pytest.fail("cursor never reached the last page")
+
+
+@pytest.mark.parametrize("order_by", ["published", "score", "created_at"])
+def test_cursor_visits_every_row_once(db, client, order_by):
+    """Rows tied on the sort value are split across pages by id"""
+    ids = _create_news(db, 10, score=0.5)
+
+    walked = _walk(client, 3, order_by)
+
+    assert sorted(walked) == sorted(ids)
+    assert len(walked) == len(set(walked))
+
+
+def test_cursor_created_at_second_precision_rows(db, client):
+    """Rows from the old CURRENT_TIMESTAMP default page correctly once migrated"""
+    ids = _create_news(db, 10)
+    db.execute(text("UPDATE news SET created_at = strftime('%Y-%m-%d %H:%M:%S', 'now')"))
+    db.commit()
+    migrate_sqlite_timestamps()
+
+    assert sorted(_walk(client, 3, "created_at")) == sorted(ids)
+
+
+def test_cursor_streamed_pages(db, client):
+    """Pages above the streaming threshold carry a cursor too"""
+    ids = _create_news(db, 130, score=0.5)
+
+    walked = _walk(client, 60, "created_at")
+
+    assert walked == sorted(ids, reverse=True)
+
+
+def test_cursor_for_other_sort_field_is_rejected(db, client):
+    """A cursor only continues the ordering it was issued for"""
+    _create_news(db, 4)
+    cursor = client.get("/news", params={"limit": 2, "order_by": "score"}).headers["x-next-cursor"]
+
+    response = client.get("/news", params={"limit": 2, "order_by": "published", "cursor": cursor})
+
+    assert response.status_code == 400
+
+
+def test_cursor_with_null_sort_value_is_rejected(client):
+    """A cursor without a sort value cannot position a page"""
+    cursor = base64.urlsafe_b64encode(orjson.dumps({"o": "score", "v": None, "i": 5})).decode()
+
+    response = client.get("/news", params={"order_by": "score", "cursor": cursor})
+
+    assert response.status_code == 400
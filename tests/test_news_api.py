@@ -0,0 +1,88 @@
+"""
+News API tests: conditional requests (ETag / Last-Modified)
+"""
+import time
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.models.news import News
+from app.repositories.news_repository import NewsRepository
+
+
+def _create(db, i: int = 1) -> int:
+    """Insert one news and return its id"""
+    news = NewsRepository(db).create(News(
+        title=f"News {i}",
+        url=f"https://example.com/{i}",
+        published=datetime(2024, 1, 1),
+        language="english",
+    ))
+    return news.id
+
+
+def test_news_by_id_sends_validators(db, client):
+    """A full response carries ETag and Last-Modified"""
+    news_id = _create(db)
+
+    response = client.get(f"/news/{news_id}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == news_id
+    assert response.headers["etag"]
+    assert response.headers["last-modified"].endswith("GMT")
+
+
+def test_news_by_id_if_none_match(db, client):
+    """A matching ETag gets an empty 304, a changed news a fresh 200"""
+    news_id = _create(db)
+    etag = client.get(f"/news/{news_id}").headers["etag"]
+
+    not_modified = client.get(f"/news/{news_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    time.sleep(0.01)  # updated_at has millisecond precision on SQLite
+    NewsRepository(db).update(news_id, title="Edited")
+
+    modified = client.get(f"/news/{news_id}", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.json()["title"] == "Edited"
+    assert modified.headers["etag"] != etag
+
+
+def test_news_by_id_if_modified_since(db, client):
+    """Last-Modified is honoured when no ETag is sent"""
+    news_id = _create(db)
+    last_modified = client.get(f"/news/{news_id}").headers["last-modified"]
+
+    current = client.get(f"/news/{news_id}", headers={"If-Modified-Since": last_modified})
+    stale = client.get(
+        f"/news/{news_id}", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+
+    assert current.status_code == 304
+    assert stale.status_code == 200
+
+
+def test_news_by_id_missing_is_404_even_with_validators(client):
+    """If-None-Match: * does not turn a missing news into a 304"""
+    response = client.get("/news/999999", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+def test_stats_etag_changes_on_write(db, client):
+    """The stats ETag hashes the payload, so any write invalidates it"""
+    _create(db, 1)
+    etag = client.get("/stats").headers["etag"]
+
+    assert client.get("/stats", headers={"If-None-Match": etag}).status_code == 304
+
+    _create(db, 2)
+    response = client.get("/stats", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
@@ -0,0 +1,277 @@
+"""
+NewsRepository tests against the SQLite test database
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from app import database
+from app.models.news import News, NewsStatus
+from app.repositories.news_repository import NewsRepository, TRANSLATION_CLAIM_TIMEOUT
+
+
+def _news(i: int, **fields) -> News:
+    """Unsaved news with unique URL"""
+    values = dict(
+        title=f"News {i}",
+        url=f"https://example.com/{i}",
+        published=datetime(2024, 1, 1),
+        language="english",
+    )
+    values.update(fields)
+    return News(**values)
+
+
+# ============================================
+# Bulk insert
+# ============================================
+
+def test_bulk_create_returns_rows_in_input_order(db):
+    """One INSERT ... RETURNING gives ids and database defaults back"""
+    repo = NewsRepository(db)
+
+    created = repo.bulk_create([_news(i, score=i / 10) for i in range(5)])
+
+    assert [news.url for news in created] == [f"https://example.com/{i}" for i in range(5)]
+    assert [news.id for news in created] == sorted(news.id for news in created)
+    assert all(news.status == NewsStatus.COLLECTED for news in created)
+    assert all(news.created_at is not None for news in created)
+
+
+def test_bulk_create_duplicate_url_inserts_nothing(db):
+    """A conflicting row fails the whole statement, which is rolled back"""
+    repo = NewsRepository(db)
+    repo.create(_news(1))
+
+    with pytest.raises(IntegrityError):
+        repo.bulk_create([_news(2), _news(1)])
+
+    assert repo.count_total() == 1
+
+
+def test_crawler_save_batch_falls_back_to_single_inserts(db):
+    """One stored URL in a page does not drop the other articles"""
+    from app.services.crawler import AsyncCrawlerService
+
+    repo = NewsRepository(db)
+    repo.create(_news(1))
+
+    saved = AsyncCrawlerService._save_batch(repo, [_news(0), _news(1), _news(2)])
+
+    assert [news.url for news in saved] == ["https://example.com/0", "https://example.com/2"]
+    assert repo.count_total() == 3
+
+
+# ============================================
+# Full-text search (SQLite FTS5)
+# ============================================
+
+def _fts_ids(repo: NewsRepository, query: str) -> list:
+    """Ids returned by search_fts(), best match first"""
+    return [row.id for row in repo.search_fts(query)]
+
+
+def test_fts_index_is_active():
+    """init_database() sets up the FTS5 table on SQLite"""
+    assert database.SQLITE_FTS
+
+
+def test_fts_finds_inserted_news(db):
+    """The insert trigger indexes title, highlight and translation"""
+    repo = NewsRepository(db)
+    first, second = repo.bulk_create([
+        _news(1, title="Oil exports rise", highlight_text="Tanker traffic grows"),
+        _news(2, title="Election results", translated_summary="Turnout was high"),
+    ])
+
+    assert _fts_ids(repo, "tanker") == [first.id]
+    assert _fts_ids(repo, "turnout") == [second.id]
+    assert _fts_ids(repo, "oil exports") == [first.id]
+
+
+def test_fts_follows_text_updates(db):
+    """The update trigger drops the old text and indexes the new one"""
+    repo = NewsRepository(db)
+    news = repo.create(_news(1, title="Drought in the south"))
+
+    assert repo.update(news.id, title="Floods in the north")
+
+    assert _fts_ids(repo, "drought") == []
+    assert _fts_ids(repo, "floods") == [news.id]
+
+
+def test_fts_forgets_deleted_news(db):
+    """The delete trigger removes the row from the index"""
+    repo = NewsRepository(db)
+    news = repo.create(_news(1, title="Currency reform"))
+
+    assert repo.delete(news.id)
+
+    assert _fts_ids(repo, "currency") == []
+
+
+def test_fts_query_operators_are_literal(db):
+    """FTS5 syntax in user input is searched as text, not parsed"""
+    repo = NewsRepository(db)
+    repo.create(_news(1, title="Talks resume"))
+
+    assert _fts_ids(repo, 'talks OR "') == []
+    assert _fts_ids(repo, "NEAR(") == []
+
+
+# ============================================
+# Translation claims
+# ============================================
+
+def _status(db, news_id: int) -> str:
+    """Current status as stored in the database"""
+    db.expire_all()
+    return db.get(News, news_id).status
+
+
+def _approved(repo: NewsRepository, count: int) -> list:
+    """Create `count` news approved for translation, highest score first"""
+    created = repo.bulk_create([
+        _news(i, status=NewsStatus.APPROVED_FOR_TRANSLATE, score=1 - i / 10)
+        for i in range(count)
+    ])
+    return [news.id for news in created]
+
+
+def test_claim_moves_news_to_translating_once(db):
+    """A claimed news is not handed to a second translator run"""
+    repo = NewsRepository(db)
+    ids = _approved(repo, 3)
+
+    first = repo.claim_for_translation(limit=2)
+    second = repo.claim_for_translation(limit=2)
+
+    assert [row.id for row in first] == ids[:2]
+    assert [row.id for row in second] == ids[2:]
+    assert repo.claim_for_translation(limit=2) == []
+    assert {_status(db, news_id) for news_id in ids} == {NewsStatus.TRANSLATING}
+
+
+def test_claim_single_news(db):
+    """news_id limits the claim to that news"""
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+
+    rows = repo.claim_for_translation(limit=1, news_id=ids[1])
+
+    assert [row.id for row in rows] == [ids[1]]
+    assert repo.claim_for_translation(limit=1, news_id=ids[1]) == []
+    assert _status(db, ids[0]) == NewsStatus.APPROVED_FOR_TRANSLATE
+
+
+def test_update_translation_requires_claim(db):
+    """Only a claimed news takes a translation, and only once"""
+    repo = NewsRepository(db)
+    news_id = _approved(repo, 1)[0]
+
+    assert repo.update_translation(news_id, "summary", "text") is False
+
+    repo.claim_for_translation(news_id=news_id)
+    assert repo.update_translation(news_id, "summary", "text") is True
+    assert repo.update_translation(news_id, "other", "other") is False
+
+    db.expire_all()
+    news = db.get(News, news_id)
+    assert (news.status, news.translated_summary) == (NewsStatus.READY_FOR_FINAL, "summary")
+
+
+def test_bulk_update_translations_skips_unclaimed(db):
+    """News not in translating are left untouched by the bulk update"""
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+    repo.claim_for_translation(news_id=ids[0])
+
+    count = repo.bulk_update_translations({news_id: ("s", "t") for news_id in ids})
+
+    assert count == 1
+    assert _status(db, ids[0]) == NewsStatus.READY_FOR_FINAL
+    assert _status(db, ids[1]) == NewsStatus.APPROVED_FOR_TRANSLATE
+
+
+def test_release_claims(db):
+    """Released news go back to approved_for_translate"""
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+    repo.claim_for_translation(limit=2)
+
+    assert repo.release_translation_claims([ids[0]]) == 1
+    assert repo.release_translation_claims([]) == 0
+
+    assert _status(db, ids[0]) == NewsStatus.APPROVED_FOR_TRANSLATE
+    assert _status(db, ids[1]) == NewsStatus.TRANSLATING
+
+
+def test_release_stale_claims_only(db):
+    """older_than releases claims abandoned by a dead run, not fresh ones"""
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+    repo.claim_for_translation(limit=2)
+    db.execute(
+        update(News).where(News.id == ids[0]).values(updated_at=datetime.utcnow() - timedelta(hours=1))
+    )
+    db.commit()
+
+    assert repo.release_translation_claims(older_than=TRANSLATION_CLAIM_TIMEOUT) == 1
+
+    assert _status(db, ids[0]) == NewsStatus.APPROVED_FOR_TRANSLATE
+    assert _status(db, ids[1]) == NewsStatus.TRANSLATING
+
+
+def test_background_translation_runs_once(db, monkeypatch):
+    """The approve task translates a claimed news and skips a taken one"""
+    from app.routers import news as news_router
+
+    calls = []
+    monkeypatch.setattr(
+        news_router.translation_service, "translate", lambda text: calls.append(text) or "ترجمه"
+    )
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+    repo.claim_for_translation(news_id=ids[1])
+
+    news_router._translate_news(ids[0])
+    news_router._translate_news(ids[0])
+    news_router._translate_news(ids[1])
+
+    assert calls == ["News 0"]
+    assert _status(db, ids[0]) == NewsStatus.READY_FOR_FINAL
+    assert _status(db, ids[1]) == NewsStatus.TRANSLATING
+
+
+def test_background_translation_failure_releases_claim(db, monkeypatch):
+    """A failed translation goes back to the queue for the scheduler"""
+    from app.routers import news as news_router
+
+    monkeypatch.setattr(news_router.translation_service, "translate", lambda text: None)
+    repo = NewsRepository(db)
+    news_id = _approved(repo, 1)[0]
+
+    news_router._translate_news(news_id)
+
+    assert _status(db, news_id) == NewsStatus.APPROVED_FOR_TRANSLATE
+
+
+def test_scheduled_translator_stores_and_requeues(db, monkeypatch):
+    """Batch successes are stored, failures released for the next run"""
+    from app import main
+
+    monkeypatch.setattr(
+        main.translation_service, "translate_batch", lambda texts: ["ترجمه", None][:len(texts)]
+    )
+    repo = NewsRepository(db)
+    ids = _approved(repo, 2)
+
+    main.scheduled_translator()
+
+    assert _status(db, ids[0]) == NewsStatus.READY_FOR_FINAL
+    assert _status(db, ids[1]) == NewsStatus.APPROVED_FOR_TRANSLATE